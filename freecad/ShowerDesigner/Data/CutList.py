@@ -12,12 +12,15 @@ from __future__ import annotations
 
 import csv
 import io
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CutListItem:
-    """Single line item in a cut list / bill of materials."""
+    """Single line item in a cut list / bill of materials.
+
+    Immutable: aggregation builds merged copies rather than editing items.
+    """
 
     category: str  # "Glass", "Hinge", "Handle", "Clamp", "Support Bar", etc.
     component: str  # Parent context: "Fixed Panel", "Hinged Door", etc.
@@ -45,32 +48,29 @@ def _itemKey(item: CutListItem) -> tuple:
 
 def aggregateItems(items: list[CutListItem]) -> list[CutListItem]:
     """Merge identical items (same category+description+product_code+dims) by summing quantities."""
+    if len(items) < 2:
+        # Nothing to merge; items are immutable, so a new list is enough
+        return list(items)
     groups: dict[tuple, CutListItem] = {}
     for item in items:
         key = _itemKey(item)
-        if key in groups:
-            groups[key].quantity += item.quantity
-            # Merge component names if different
-            existing = groups[key].component
-            if item.component and item.component not in existing:
-                groups[key].component = f"{existing}, {item.component}"
-        else:
-            # Copy so we don't mutate the original
-            groups[key] = CutListItem(
-                category=item.category,
-                component=item.component,
-                description=item.description,
-                product_code=item.product_code,
-                width=item.width,
-                height=item.height,
-                quantity=item.quantity,
-                unit=item.unit,
-                notes=item.notes,
-            )
+        merged = groups.get(key)
+        if merged is None:
+            groups[key] = item
+            continue
+        component = merged.component
+        # Merge component names if different
+        if item.component and item.component not in component:
+            component = f"{component}, {item.component}"
+        groups[key] = replace(
+            merged,
+            quantity=merged.quantity + item.quantity,
+            component=component,
+        )
     return list(groups.values())
 
 
-_CSV_HEADERS = [
+_CSV_HEADERS = (
     "Category",
     "Component",
     "Description",
@@ -80,7 +80,22 @@ _CSV_HEADERS = [
     "Qty",
     "Unit",
     "Notes",
-]
+)
+
+
+def _itemRow(item: CutListItem) -> list[str]:
+    """Format one item as display cells in _CSV_HEADERS order."""
+    return [
+        item.category,
+        item.component,
+        item.description,
+        item.product_code,
+        f"{item.width:.0f}" if item.width else "",
+        f"{item.height:.0f}" if item.height else "",
+        str(item.quantity),
+        item.unit,
+        item.notes,
+    ]
 
 
 def toCSV(items: list[CutListItem]) -> str:
@@ -88,36 +103,14 @@ def toCSV(items: list[CutListItem]) -> str:
     buf = io.StringIO()
     writer = csv.writer(buf)
     writer.writerow(_CSV_HEADERS)
-    for item in items:
-        writer.writerow([
-            item.category,
-            item.component,
-            item.description,
-            item.product_code,
-            f"{item.width:.0f}" if item.width else "",
-            f"{item.height:.0f}" if item.height else "",
-            item.quantity,
-            item.unit,
-            item.notes,
-        ])
+    writer.writerows(map(_itemRow, items))
     return buf.getvalue()
 
 
 def toTable(items: list[CutListItem]) -> list[list[str]]:
     """Format as list of rows (header + data) for Qt table display."""
     rows: list[list[str]] = [list(_CSV_HEADERS)]
-    for item in items:
-        rows.append([
-            item.category,
-            item.component,
-            item.description,
-            item.product_code,
-            f"{item.width:.0f}" if item.width else "",
-            f"{item.height:.0f}" if item.height else "",
-            str(item.quantity),
-            item.unit,
-            item.notes,
-        ])
+    rows.extend(map(_itemRow, items))
     return rows
 
 
@@ -127,19 +120,14 @@ def toConsoleTable(items: list[CutListItem]) -> str:
     if len(rows) <= 1:
         return "  (no items)\n"
 
-    # Calculate column widths
-    col_widths = [0] * len(rows[0])
-    for row in rows:
-        for i, cell in enumerate(row):
-            col_widths[i] = max(col_widths[i], len(cell))
-
-    lines = []
-    # Header
-    header = "  ".join(cell.ljust(col_widths[i]) for i, cell in enumerate(rows[0]))
-    lines.append(header)
-    lines.append("-" * len(header))
-    # Data rows
-    for row in rows[1:]:
-        lines.append("  ".join(cell.ljust(col_widths[i]) for i, cell in enumerate(row)))
+    # Column width = widest cell in that column, header included
+    col_widths = [max(map(len, column)) for column in zip(*rows)]
+
+    lines = [
+        "  ".join(cell.ljust(width) for cell, width in zip(row, col_widths))
+        for row in rows
+    ]
+    # Rule under the header
+    lines.insert(1, "-" * len(lines[0]))
 
     return "\n".join(lines) + "\n"
@@ -14,7 +14,7 @@ Pure Python — no FreeCAD imports. Models import from here, never the reverse.
 # ---------------------------------------------------------------------------
 # Shared finish list
 # ---------------------------------------------------------------------------
-HARDWARE_FINISHES = ["Chrome", "Brushed-Nickel", "Matte-Black", "Gold"]
+HARDWARE_FINISHES = ("Chrome", "Brushed-Nickel", "Matte-Black", "Gold")
 
 # ---------------------------------------------------------------------------
 # Hinge specifications (generic / legacy)
@@ -156,7 +156,7 @@ class AlcoveEnclosureAssembly(AssemblyController):
             "App::PropertyEnumeration", "HardwareFinish", "Hardware Display",
             "Finish for all hardware"
         )
-        vs.HardwareFinish = HARDWARE_FINISHES[:]
+        vs.HardwareFinish = HARDWARE_FINISHES
         vs.HardwareFinish = "Chrome"
 
     # Map inline DoorType values to the door assembly class they use
@@ -807,5 +807,5 @@ def createAlcoveEnclosure(name="AlcoveEnclosure"):
     AlcoveEnclosureAssembly(part)
 
     doc.recompute()
-    App.Console.PrintMessage(f"Alcove enclosure '{name}' created\n")
+    App.Console.PrintLog(f"Alcove enclosure '{name}' created\n")
     return part
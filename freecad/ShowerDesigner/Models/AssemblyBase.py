@@ -35,8 +35,14 @@ class AssemblyController:
     objects, and synchronizing hardware finish across children.
     """
 
+    # _lastShowHardware -- ShowHardware value last applied to the hardware
+    #                      children's Visibility (None until first applied);
+    #                      saved with the document so a reload keeps it
+    __slots__ = ("_manifest", "_lastShowHardware")
+
     def __init__(self, part_obj):
         self._manifest = {}
+        self._lastShowHardware = None
 
         # Create hidden controller inside the App::Part
         doc = part_obj.Document
@@ -200,6 +206,34 @@ class AssemblyController:
                 **proxy_kwargs
             )
 
+    # ------------------------------------------------------------------
+    # Hardware visibility
+    # ------------------------------------------------------------------
+
+    def _setHardwareVisibility(self, part_obj, visible):
+        """
+        Show or hide every hardware child in this assembly without
+        removing it, so toggling hardware display does not rebuild shapes.
+        """
+        from freecad.ShowerDesigner.Models.ChildProxies import isHardwareChild
+        for child in part_obj.Group:
+            if not isHardwareChild(child):
+                continue
+            if child.Visibility != visible:
+                child.Visibility = visible
+
+    def _applyShowHardware(self, part_obj, show_hw):
+        """
+        Apply the ShowHardware flag to the hardware children's Visibility.
+
+        Visibility is only written when the flag changes from the value
+        last applied, so an ordinary recompute leaves children the user
+        hid by hand in the tree alone.
+        """
+        if self._lastShowHardware is not None and show_hw != self._lastShowHardware:
+            self._setHardwareVisibility(part_obj, show_hw)
+        self._lastShowHardware = show_hw
+
     # ------------------------------------------------------------------
     # Hardware finish propagation
     # ------------------------------------------------------------------
@@ -297,10 +331,15 @@ class AssemblyController:
     # ------------------------------------------------------------------
 
     def __getstate__(self):
-        return {"manifest": self._manifest}
+        return {
+            "manifest": self._manifest,
+            "lastShowHardware": self._lastShowHardware,
+        }
 
     def __setstate__(self, state):
         if state:
             self._manifest = state.get("manifest", {})
+            self._lastShowHardware = state.get("lastShowHardware")
         else:
             self._manifest = {}
+            self._lastShowHardware = None
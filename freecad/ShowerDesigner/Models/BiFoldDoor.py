@@ -7,7 +7,6 @@ wall hinges, fold hinges, handle, and optional folded-position ghost.
 """
 
 import FreeCAD as App
-import Part
 from freecad.ShowerDesigner.Models.AssemblyBase import AssemblyController
 from freecad.ShowerDesigner.Models.ChildProxies import (
     GlassChild,
@@ -167,7 +166,7 @@ class BiFoldDoorAssembly(AssemblyController):
         ).HandleLength = 300
 
         # Hardware display
-        all_finishes = HARDWARE_FINISHES[:] + [
+        all_finishes = list(HARDWARE_FINISHES) + [
             f for f in MONZA_FINISHES if f not in HARDWARE_FINISHES
         ]
         vs.addProperty(
@@ -320,6 +319,8 @@ class BiFoldDoorAssembly(AssemblyController):
         use_monza = hasattr(vs, "HingeModel") and vs.HingeModel == "Monza"
 
         # --- Wall hinges (always 2, top and bottom) ---
+        # Hidden hardware is kept as is and brought up to date when shown
+        # again, rather than deleted and rebuilt on every toggle
         if show_hw:
             if use_monza:
                 # Remove legacy wall hinges if present, then use Monza
@@ -331,11 +332,6 @@ class BiFoldDoorAssembly(AssemblyController):
                     part_obj, "MonzaWallHinge", 0, MonzaWallHingeChild
                 )
                 self._updateWallHinges(part_obj, vs)
-        else:
-            self._syncChildCount(part_obj, "WallHinge", 0, HingeChild)
-            self._syncChildCount(
-                part_obj, "MonzaWallHinge", 0, MonzaWallHingeChild
-            )
 
         # --- Fold hinges ---
         if show_hw:
@@ -347,18 +343,13 @@ class BiFoldDoorAssembly(AssemblyController):
                     part_obj, "MonzaFoldHinge", 0, MonzaFoldHingeChild
                 )
                 self._updateFoldHinges(part_obj, vs)
-        else:
-            self._syncChildCount(part_obj, "FoldHinge", 0, HingeChild)
-            self._syncChildCount(
-                part_obj, "MonzaFoldHinge", 0, MonzaFoldHingeChild
-            )
 
         # --- Handle ---
-        if show_hw and vs.HandleType != "None":
-            self._updateHandle(part_obj, vs)
-        else:
+        if vs.HandleType == "None":
             if self._hasChild(part_obj, "Handle"):
                 self._removeChild(part_obj, "Handle")
+        elif show_hw:
+            self._updateHandle(part_obj, vs)
 
         # --- Ghost ---
         if vs.ShowFoldedPosition:
@@ -366,6 +357,7 @@ class BiFoldDoorAssembly(AssemblyController):
         else:
             if self._hasChild(part_obj, "Ghost"):
                 self._removeChild(part_obj, "Ghost")
+        self._applyShowHardware(part_obj, show_hw)
 
         # --- Finish ---
         self._updateAllHardwareFinish(part_obj, finish)
@@ -628,8 +620,7 @@ class BiFoldDoorAssembly(AssemblyController):
         width = vs.Width.Value
         height = vs.Height.Value
         thickness = vs.Thickness.Value
-        panel_width = width / 2
-        folded_width = panel_width + thickness
+        _, folded_width, _, _ = _calculateFoldDimensions(width, thickness)
 
         child.GhostWidth = folded_width
         child.GhostDepth = thickness * 2 + 5
@@ -653,7 +644,9 @@ class BiFoldDoorAssembly(AssemblyController):
             width = vs.Width.Value
             height = vs.Height.Value
             thickness = vs.Thickness.Value
-            panel_width = width / 2
+            panel_width, folded_width, opening_width, clearance_depth = (
+                _calculateFoldDimensions(width, thickness)
+            )
 
             width_m = width / 1000.0
             height_m = height / 1000.0
@@ -676,13 +669,12 @@ class BiFoldDoorAssembly(AssemblyController):
 
             if hasattr(vs, "PanelWidth"):
                 vs.PanelWidth = panel_width
-            folded_width = panel_width + thickness
             if hasattr(vs, "FoldedWidth"):
                 vs.FoldedWidth = folded_width
             if hasattr(vs, "OpeningWidth"):
-                vs.OpeningWidth = width - folded_width
+                vs.OpeningWidth = opening_width
             if hasattr(vs, "ClearanceDepth"):
-                vs.ClearanceDepth = panel_width
+                vs.ClearanceDepth = clearance_depth
             if hasattr(vs, "MaxFoldAngle"):
                 vs.MaxFoldAngle = spec.get("primary_angle", 180)
 
@@ -705,9 +697,21 @@ class BiFoldDoorAssembly(AssemblyController):
 
 
 # ======================================================================
-# Helper
+# Helpers
 # ======================================================================
 
+def _calculateFoldDimensions(width, thickness):
+    """
+    Derive the bi-fold footprint from the overall width and glass thickness.
+
+    Returns:
+        (panel_width, folded_width, opening_width, clearance_depth) in mm
+    """
+    panel_width = width / 2
+    folded_width = panel_width + thickness
+    return panel_width, folded_width, width - folded_width, panel_width
+
+
 def _calculateHingePositions(height, count):
     offset_top = HINGE_PLACEMENT_DEFAULTS["offset_top"]
     offset_bottom = HINGE_PLACEMENT_DEFAULTS["offset_bottom"]
@@ -741,5 +745,5 @@ def createBiFoldDoor(name="BiFoldDoor"):
     BiFoldDoorAssembly(part)
 
     doc.recompute()
-    App.Console.PrintMessage(f"Bi-fold door '{name}' created\n")
+    App.Console.PrintLog(f"Bi-fold door '{name}' created\n")
     return part
@@ -455,24 +455,23 @@ class SliderTrackChild:
                 tube_r, length,
                 App.Vector(0, 0, spacing), App.Vector(1, 0, 0)
             )
-            shape = tube1.fuse(tube2)
+            # Collect all parts and fuse them in a single boolean operation
+            parts = [tube2]
 
             # Wall flanges (4x): sleeves over tube ends
             flange_r = 12.5  # 25mm outer diameter
             flange_len = 25
             for z in [0, spacing]:
                 # Flange at start (extends backward from X=0)
-                f = Part.makeCylinder(
+                parts.append(Part.makeCylinder(
                     flange_r, flange_len,
                     App.Vector(-flange_len, 0, z), App.Vector(1, 0, 0)
-                )
-                shape = shape.fuse(f)
+                ))
                 # Flange at end
-                f = Part.makeCylinder(
+                parts.append(Part.makeCylinder(
                     flange_r, flange_len,
                     App.Vector(length, 0, z), App.Vector(1, 0, 0)
-                )
-                shape = shape.fuse(f)
+                ))
 
             # Tube support bracket at fixed panel junction
             support_x = 0
@@ -497,8 +496,8 @@ class SliderTrackChild:
                         plate_z - tab_h
                     )
                 )
-                shape = shape.fuse(plate).fuse(tab)
-            obj.Shape = shape.removeSplitter()
+                parts.extend((plate, tab))
+            obj.Shape = tube1.fuse(parts).removeSplitter()
         elif system_key == "city_slider":
             # City slider: U-channel profile from technical drawing
             track_w = dims["track_width"]   # 55mm
@@ -522,7 +521,7 @@ class SliderTrackChild:
                 length, wall_t, wall_h,
                 App.Vector(0, track_w - wall_t, 0)
             )
-            shape = upper.fuse(left_wall).fuse(right_wall)
+            shape = upper.fuse([left_wall, right_wall])
             obj.Shape = shape.removeSplitter()
         else:
             # Edge slider: simple rectangular track profile
@@ -542,7 +541,7 @@ class SliderTrackChild:
                 flange_proj, track_w+5, track_h+5,
                 App.Vector(length-flange_proj, -2.5, -2.5)
             )
-            shape = shape.fuse(f1).fuse(f2)
+            shape = shape.fuse([f1, f2])
             obj.Shape = shape.removeSplitter()
 
     def onChanged(self, obj, prop):
@@ -559,6 +558,10 @@ class SliderTrackChild:
 # Slider Roller (catalogue slider systems)
 # ======================================================================
 
+# Roller wheel shapes keyed by (radius, width), shared by all rollers
+_roller_shape_cache = {}
+
+
 class SliderRollerChild:
     """Proxy for a catalogue slider system roller child."""
 
@@ -582,34 +585,16 @@ class SliderRollerChild:
         if system_key == "duplo":
             radius = dims["roller_wheel_diameter"] / 2
             wheel_w = dims["roller_wheel_width"]
-            # Duplo roller: wheel axis along Y, centered on origin
-            obj.Shape = Part.makeCylinder(
-                radius, wheel_w,
-                App.Vector(0, 0, 0), App.Vector(0, 1, 0)
-            )
-            return
         elif system_key == "edge_slider":
             radius = dims["roller_wheel_diameter"] / 2
             wheel_w = 10
-            obj.Shape = Part.makeCylinder(
-                radius, wheel_w,
-                App.Vector(0, 0, 0), App.Vector(0, 1, 0)
-            )
-            return
         else:
             # City slider — use spec-based roller dimensions
             radius = dims.get("roller_wheel_diameter", 24) / 2
             wheel_w = 10
-            obj.Shape = Part.makeCylinder(
-                radius, wheel_w,
-                App.Vector(0, 0, 0), App.Vector(0, 1, 0)
-            )
-            return
 
-        obj.Shape = Part.makeCylinder(
-            radius, height,
-            App.Vector(0, 0, 0), App.Vector(0, 0, 1)
-        )
+        # Roller wheel: axis along Y, centered on origin
+        obj.Shape = _getRollerShape(radius, wheel_w)
 
     def onChanged(self, obj, prop):
         pass
@@ -621,6 +606,23 @@ class SliderRollerChild:
         return None
 
 
+def _getRollerShape(radius, wheel_w):
+    """Return a copy of the cached roller wheel cylinder for this size.
+
+    Every roller of a given size is identical and positioned through its
+    Placement, so the cylinder is built once and copied per roller.
+    """
+    key = (radius, wheel_w)
+    proto = _roller_shape_cache.get(key)
+    if proto is None:
+        proto = Part.makeCylinder(
+            radius, wheel_w,
+            App.Vector(0, 0, 0), App.Vector(0, 1, 0)
+        )
+        _roller_shape_cache[key] = proto
+    return proto.copy()
+
+
 # ======================================================================
 # Anti-Lift Pin (edge slider system)
 # ======================================================================
@@ -756,3 +758,29 @@ class GlassShelfChild:
 
     def __setstate__(self, state):
         return None
+
+
+# ======================================================================
+# Role check
+# ======================================================================
+
+# Children that an assembly's ShowHardware flag hides and the cut list
+# leaves out while it is off; glass, shelves and preview geometry are not
+_HARDWARE_PROXIES = (
+    HingeChild,
+    HandleChild,
+    ClampChild,
+    SupportBarChild,
+    ChannelChild,
+    MonzaWallHingeChild,
+    MonzaFoldHingeChild,
+    SliderTrackChild,
+    SliderRollerChild,
+    AntiLiftPinChild,
+    SliderFloorGuideChild,
+)
+
+
+def isHardwareChild(obj):
+    """True if obj is a hardware child of an assembly (hinge, clamp, ...)."""
+    return isinstance(getattr(obj, "Proxy", None), _HARDWARE_PROXIES)
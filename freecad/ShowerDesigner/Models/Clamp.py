@@ -17,6 +17,8 @@ Supported clamp shapes:
     90DEG_Tee_Clamp — Glass-to-glass T-junction clamp (3 panels)
 """
 
+from functools import lru_cache
+
 import FreeCAD as App
 import Part
 from freecad.ShowerDesigner.Data.HardwareSpecs import (
@@ -282,6 +284,15 @@ def createClampShape(clamp_type="L_Clamp"):
     Returns:
         Part.Shape representing the clamp
     """
+    return _cachedClampShape(clamp_type).copy()
+
+
+@lru_cache(maxsize=32)
+def _cachedClampShape(clamp_type):
+    """Build the clamp solid once per type; the fuses and cuts are costly.
+
+    Callers must copy the result; the cached shape is shared.
+    """
     spec = CLAMP_SPECS.get(clamp_type)
     if spec is None:
         spec = CLAMP_SPECS["L_Clamp"]
@@ -367,7 +378,7 @@ class Clamp:
             "Clamp",
             "Hardware finish"
         )
-        obj.Finish = HARDWARE_FINISHES[:]
+        obj.Finish = HARDWARE_FINISHES
         obj.Finish = "Chrome"
 
     def execute(self, obj):
@@ -412,5 +423,5 @@ def createClamp(name="Clamp"):
         obj.ViewObject.Proxy = 0
 
     doc.recompute()
-    App.Console.PrintMessage(f"Clamp '{name}' created\n")
+    App.Console.PrintLog(f"Clamp '{name}' created\n")
     return obj
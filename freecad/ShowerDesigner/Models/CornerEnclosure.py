@@ -7,7 +7,6 @@ and a door (hinged or sliding) at 90 degrees.
 """
 
 import FreeCAD as App
-import Part
 from freecad.ShowerDesigner.Models.AssemblyBase import AssemblyController
 from freecad.ShowerDesigner.Models.ChildProxies import (
     SupportBarChild,
@@ -169,7 +168,7 @@ class CornerEnclosureAssembly(AssemblyController):
             "App::PropertyEnumeration", "HardwareFinish", "Hardware Display",
             "Finish for all hardware"
         )
-        vs.HardwareFinish = HARDWARE_FINISHES[:]
+        vs.HardwareFinish = HARDWARE_FINISHES
         vs.HardwareFinish = "Chrome"
 
     def _createNestedPanels(self, part_obj, vs):
@@ -790,5 +789,5 @@ def createCornerEnclosure(name="CornerEnclosure"):
     CornerEnclosureAssembly(part)
 
     doc.recompute()
-    App.Console.PrintMessage(f"Corner enclosure '{name}' created\n")
+    App.Console.PrintLog(f"Corner enclosure '{name}' created\n")
     return part
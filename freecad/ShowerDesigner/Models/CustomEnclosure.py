@@ -9,7 +9,6 @@ Users can add/remove panels and doors to build any enclosure shape.
 """
 
 import FreeCAD as App
-import Part
 from freecad.ShowerDesigner.Models.AssemblyBase import AssemblyController
 from freecad.ShowerDesigner.Data.HardwareSpecs import HARDWARE_FINISHES
 from freecad.ShowerDesigner.Data.PanelConstraints import validatePanelToPanelGap
@@ -69,7 +68,7 @@ class CustomEnclosureAssembly(AssemblyController):
             "App::PropertyEnumeration", "HardwareFinish", "Hardware Display",
             "Finish for all hardware"
         )
-        vs.HardwareFinish = HARDWARE_FINISHES[:]
+        vs.HardwareFinish = HARDWARE_FINISHES
         vs.HardwareFinish = "Chrome"
 
     def _createDefaultPanels(self, part_obj, vs):
@@ -220,5 +219,5 @@ def createCustomEnclosure(name="CustomEnclosure"):
     CustomEnclosureAssembly(part)
 
     doc.recompute()
-    App.Console.PrintMessage(f"Custom enclosure '{name}' created\n")
+    App.Console.PrintLog(f"Custom enclosure '{name}' created\n")
     return part
@@ -28,6 +28,7 @@ from freecad.ShowerDesigner.Data.HardwareSpecs import (
     SLIDER_SYSTEM_SPECS,
     SUPPORT_BAR_SPECS,
 )
+from freecad.ShowerDesigner.Models.ChildProxies import isHardwareChild
 
 # Proxy class names that are visualization-only (no BOM entry)
 _SKIP_PROXIES = {"SwingArcChild", "GhostChild"}
@@ -74,14 +75,17 @@ class CutListExtractor:
         """Walk an App::Part container's Group."""
         items: list[CutListItem] = []
         group = getattr(part_obj, "Group", [])
-        varset = None
+        varset = next(
+            (c for c in group if getattr(c, "TypeId", "") == "App::VarSet"),
+            None,
+        )
+        show_hw = getattr(varset, "ShowHardware", True)
 
         for child in group:
             child_type = child.TypeId if hasattr(child, "TypeId") else ""
 
-            # Capture VarSet for seal extraction
+            # VarSet is read for seals below
             if child_type == "App::VarSet":
-                varset = child
                 continue
             if hasattr(child, "Label") and child.Label.startswith("_Controller"):
                 continue
@@ -91,6 +95,11 @@ class CutListExtractor:
                 items.extend(self._walkPart(child, child.Label))
                 continue
 
+            # Hardware kept in the Group while the assembly's ShowHardware
+            # is off is left out of the cut list as if it had been removed
+            if not show_hw and isHardwareChild(child):
+                continue
+
             # Part::FeaturePython → extract child
             if hasattr(child, "Proxy") and child.Proxy is not None:
                 item = self._extractChild(child, component_name)
@@ -9,7 +9,6 @@ with an individual ViewProvider, allowing independent display control.
 """
 
 import FreeCAD as App
-import Part
 from freecad.ShowerDesigner.Models.AssemblyBase import AssemblyController
 from freecad.ShowerDesigner.Models.ChildProxies import (
     GlassChild,
@@ -174,7 +173,7 @@ class FixedPanelAssembly(AssemblyController):
             "App::PropertyEnumeration", "HardwareFinish", "Hardware Display",
             "Finish for all hardware"
         )
-        vs.HardwareFinish = HARDWARE_FINISHES[:]
+        vs.HardwareFinish = HARDWARE_FINISHES
         vs.HardwareFinish = "Chrome"
         vs.addProperty(
             "App::PropertyBool", "ShowHardware", "Hardware Display",
@@ -314,27 +313,32 @@ class FixedPanelAssembly(AssemblyController):
         show_hw = vs.ShowHardware
         finish = vs.HardwareFinish
 
-        # --- Wall hardware ---
-        if show_hw and vs.WallHardware == "Clamp":
-            self._updateWallClamps(part_obj, vs)
-        else:
-            self._removeWallClamps(part_obj)
+        if show_hw:
+            # --- Wall hardware ---
+            if vs.WallHardware == "Clamp":
+                self._updateWallClamps(part_obj, vs)
+            else:
+                self._removeWallClamps(part_obj)
 
-        if show_hw and vs.WallHardware == "Channel":
-            self._updateWallChannels(part_obj, vs)
-        else:
-            self._removeWallChannels(part_obj)
+            if vs.WallHardware == "Channel":
+                self._updateWallChannels(part_obj, vs)
+            else:
+                self._removeWallChannels(part_obj)
 
-        # --- Floor hardware ---
-        if show_hw and vs.FloorHardware == "Clamp":
-            self._updateFloorClamps(part_obj, vs)
-        else:
-            self._removeFloorClamps(part_obj)
+            # --- Floor hardware ---
+            if vs.FloorHardware == "Clamp":
+                self._updateFloorClamps(part_obj, vs)
+            else:
+                self._removeFloorClamps(part_obj)
 
-        if show_hw and vs.FloorHardware == "Channel":
-            self._updateFloorChannel(part_obj, vs)
-        else:
-            self._removeFloorChannel(part_obj)
+            if vs.FloorHardware == "Channel":
+                self._updateFloorChannel(part_obj, vs)
+            else:
+                self._removeFloorChannel(part_obj)
+
+        # Hidden hardware is kept as is and brought up to date when shown
+        # again, rather than deleted and rebuilt on every toggle
+        self._applyShowHardware(part_obj, show_hw)
 
         # --- Hardware finish ---
         self._updateAllHardwareFinish(part_obj, finish)
@@ -596,5 +600,5 @@ def createFixedPanel(name="FixedPanel"):
     FixedPanelAssembly(part)
 
     doc.recompute()
-    App.Console.PrintMessage(f"Fixed panel '{name}' created\n")
+    App.Console.PrintLog(f"Fixed panel '{name}' created\n")
     return part
@@ -231,5 +231,5 @@ def createGlassPanel(name="GlassPanel"):
 
     doc.recompute()
 
-    App.Console.PrintMessage(f"Glass panel '{name}' created\n")
+    App.Console.PrintLog(f"Glass panel '{name}' created\n")
     return obj
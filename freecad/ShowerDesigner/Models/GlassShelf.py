@@ -179,5 +179,5 @@ def createGlassShelf(name="GlassShelf"):
     setupViewProvider(obj)
 
     doc.recompute()
-    App.Console.PrintMessage(f"Glass shelf '{name}' created\n")
+    App.Console.PrintLog(f"Glass shelf '{name}' created\n")
     return obj
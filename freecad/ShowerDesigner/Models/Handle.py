@@ -189,7 +189,7 @@ class Handle:
             "Handle",
             "Hardware finish"
         )
-        obj.Finish = HARDWARE_FINISHES[:]
+        obj.Finish = HARDWARE_FINISHES
         obj.Finish = "Chrome"
 
         obj.addProperty(
@@ -250,5 +250,5 @@ def createHandle(name="Handle"):
         obj.ViewObject.Proxy = 0
 
     doc.recompute()
-    App.Console.PrintMessage(f"Handle '{name}' created\n")
+    App.Console.PrintLog(f"Handle '{name}' created\n")
     return obj
@@ -555,7 +555,7 @@ class Hinge:
         )
         obj.setEditorMode("LoadCapacity", 1)
 
-        all_finishes = HARDWARE_FINISHES[:] + [
+        all_finishes = list(HARDWARE_FINISHES) + [
             f for f in BEVEL_FINISHES if f not in HARDWARE_FINISHES
         ]
         obj.addProperty(
@@ -627,7 +627,7 @@ def createHinge(name="Hinge"):
         obj.ViewObject.Proxy = 0
 
     doc.recompute()
-    App.Console.PrintMessage(f"Hinge '{name}' created\n")
+    App.Console.PrintLog(f"Hinge '{name}' created\n")
     return obj
 
 
@@ -9,7 +9,6 @@ with their own ViewProviders for independent display control.
 """
 
 import FreeCAD as App
-import Part
 from freecad.ShowerDesigner.Models.AssemblyBase import AssemblyController
 from freecad.ShowerDesigner.Models.ChildProxies import (
     GlassChild,
@@ -171,7 +170,7 @@ class HingedDoorAssembly(AssemblyController):
         ).HandleLength = 300
 
         # Hardware display
-        all_finishes = HARDWARE_FINISHES[:] + [
+        all_finishes = list(HARDWARE_FINISHES) + [
             f for f in BEVEL_FINISHES if f not in HARDWARE_FINISHES
         ]
         vs.addProperty(
@@ -282,17 +281,17 @@ class HingedDoorAssembly(AssemblyController):
         finish = vs.HardwareFinish
 
         # --- Hinges ---
+        # Hidden hardware is kept as is and brought up to date when shown
+        # again, rather than deleted and rebuilt on every toggle
         if show_hw:
             self._updateHinges(part_obj, vs)
-        else:
-            self._syncChildCount(part_obj, "Hinge", 0, HingeChild)
 
         # --- Handle ---
-        if show_hw and vs.HandleType != "None":
-            self._updateHandle(part_obj, vs)
-        else:
+        if vs.HandleType == "None":
             if self._hasChild(part_obj, "Handle"):
                 self._removeChild(part_obj, "Handle")
+        elif show_hw:
+            self._updateHandle(part_obj, vs)
 
         # --- Swing Arc ---
         if vs.ShowSwingArc:
@@ -300,6 +299,7 @@ class HingedDoorAssembly(AssemblyController):
         else:
             if self._hasChild(part_obj, "SwingArc"):
                 self._removeChild(part_obj, "SwingArc")
+        self._applyShowHardware(part_obj, show_hw)
 
         # --- Hardware finish ---
         self._updateAllHardwareFinish(part_obj, finish)
@@ -726,5 +726,5 @@ def createHingedDoor(name="HingedDoor"):
     HingedDoorAssembly(part)
 
     doc.recompute()
-    App.Console.PrintMessage(f"Hinged door '{name}' created\n")
+    App.Console.PrintLog(f"Hinged door '{name}' created\n")
     return part
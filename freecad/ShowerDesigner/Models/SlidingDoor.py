@@ -11,7 +11,6 @@ assembly is needed.
 """
 
 import FreeCAD as App
-import Part
 from freecad.ShowerDesigner.Models.AssemblyBase import AssemblyController
 from freecad.ShowerDesigner.Models.ChildProxies import (
     GlassChild,
@@ -26,6 +25,7 @@ from freecad.ShowerDesigner.Data.HardwareSpecs import (
     HARDWARE_FINISHES,
     SLIDER_SYSTEM_SPECS,
     FLOOR_GUIDE_SPECS,
+    validateSliderSystem,
 )
 from freecad.ShowerDesigner.Data.GlassSpecs import GLASS_SPECS
 from freecad.ShowerDesigner.Data.SealSpecs import (
@@ -63,6 +63,8 @@ class SlidingDoorAssembly(AssemblyController):
       - SliderFloorGuide child
     """
 
+    __slots__ = ()
+
     def __init__(self, part_obj):
         super().__init__(part_obj)
         vs = self._getOrCreateVarSet(part_obj)
@@ -167,7 +169,7 @@ class SlidingDoorAssembly(AssemblyController):
             "App::PropertyEnumeration", "HardwareFinish", "Hardware Display",
             "Finish for all hardware"
         )
-        vs.HardwareFinish = HARDWARE_FINISHES[:]
+        vs.HardwareFinish = HARDWARE_FINISHES
         vs.HardwareFinish = "Chrome"
         vs.addProperty(
             "App::PropertyBool", "ShowHardware", "Hardware Display",
@@ -253,47 +255,48 @@ class SlidingDoorAssembly(AssemblyController):
             App.Console.PrintError("Invalid door dimensions\n")
             return
 
-        panel_count = max(1, min(2, vs.PanelCount))
+        panel_count = _clampPanelCount(vs.PanelCount)
         system_key = vs.SliderSystem
         show_hw = vs.ShowHardware
         finish = vs.HardwareFinish
+        slides_right = vs.SlideDirection == "Right"
 
         # --- Glass panels ---
-        self._updatePanels(part_obj, vs, panel_count)
+        self._updatePanels(part_obj, vs, panel_count, slides_right)
 
         # --- Handle ---
-        if show_hw and vs.HandleType != "None":
-            self._updateHandle(part_obj, vs)
-        else:
+        # Hidden hardware is kept as is and brought up to date when shown
+        # again, rather than deleted and rebuilt on every toggle
+        if vs.HandleType == "None":
             if self._hasChild(part_obj, "Handle"):
                 self._removeChild(part_obj, "Handle")
+        elif show_hw:
+            self._updateHandle(part_obj, vs, slides_right)
 
         # --- Slider hardware ---
         if show_hw:
-            self._updateSliderTrack(part_obj, vs, system_key)
-            self._updateSliderFloorGuide(part_obj, vs, system_key)
-            self._updateSliderRollers(part_obj, vs, system_key, panel_count)
+            self._updateSliderTrack(
+                part_obj, vs, system_key, panel_count, slides_right
+            )
+            self._updateSliderFloorGuide(part_obj, vs, slides_right)
+            self._updateSliderRollers(
+                part_obj, vs, system_key, panel_count, slides_right
+            )
             self._updateAntiLiftPins(part_obj, vs, system_key, panel_count)
-        else:
-            if self._hasChild(part_obj, "SliderTrack"):
-                self._removeChild(part_obj, "SliderTrack")
-            if self._hasChild(part_obj, "SliderFloorGuide"):
-                self._removeChild(part_obj, "SliderFloorGuide")
-            self._syncChildCount(part_obj, "SliderRoller", 0, SliderRollerChild)
-            self._syncChildCount(part_obj, "AntiLiftPin", 0, AntiLiftPinChild)
+        self._applyShowHardware(part_obj, show_hw)
 
         # --- Finish ---
         self._updateAllHardwareFinish(part_obj, finish)
 
         # --- Validation & calculated ---
         self._validateSliderSystem(vs, system_key)
-        self._updateCalculatedProperties(vs)
+        self._updateCalculatedProperties(vs, panel_count)
 
     # ------------------------------------------------------------------
     # Glass deductions
     # ------------------------------------------------------------------
 
-    def _calculateGlassDeductions(self, vs):
+    def _calculateGlassDeductions(self, vs, slides_right):
         """Calculate per-edge glass deductions based on slider system.
 
         The glass is cut smaller than the nominal opening so it clears the
@@ -329,7 +332,7 @@ class SlidingDoorAssembly(AssemblyController):
         glass_height = max(height - top_ded - bottom_ded, 1.0)
 
         # Handle is opposite slide direction; offset glass when handle is left
-        if vs.SlideDirection == "Right":
+        if slides_right:
             x_offset = 0.0  # handle on left, glass starts at origin
         else:
             x_offset = seal_ded  # handle on right, shift glass right
@@ -340,9 +343,11 @@ class SlidingDoorAssembly(AssemblyController):
     # Panel management
     # ------------------------------------------------------------------
 
-    def _updatePanels(self, part_obj, vs, panel_count):
+    def _updatePanels(self, part_obj, vs, panel_count, slides_right):
         thickness = vs.Thickness.Value
-        glass_w, glass_h, x_off, z_off = self._calculateGlassDeductions(vs)
+        glass_w, glass_h, x_off, z_off = self._calculateGlassDeductions(
+            vs, slides_right
+        )
 
         # Panel 1 always exists
         panel1 = self._getChild(part_obj, "Panel1")
@@ -380,7 +385,7 @@ class SlidingDoorAssembly(AssemblyController):
     # Handle management
     # ------------------------------------------------------------------
 
-    def _updateHandle(self, part_obj, vs):
+    def _updateHandle(self, part_obj, vs, slides_right):
         if not self._hasChild(part_obj, "Handle"):
             self._addChild(
                 part_obj, "Handle", HandleChild,
@@ -396,10 +401,10 @@ class SlidingDoorAssembly(AssemblyController):
 
         width = vs.Width.Value
         thickness = vs.Thickness.Value
-        handle_height = min(vs.HandleHeight.Value, vs.Height.Value - 100)
+        handle_height = _clampHandleHeight(vs.HandleHeight.Value, vs.Height.Value)
         handle_offset = vs.HandleOffset.Value
 
-        if vs.SlideDirection == "Right":
+        if slides_right:
             x_pos = handle_offset
         else:
             x_pos = width - handle_offset
@@ -423,7 +428,8 @@ class SlidingDoorAssembly(AssemblyController):
     # Slider track
     # ------------------------------------------------------------------
 
-    def _updateSliderTrack(self, part_obj, vs, system_key):
+    def _updateSliderTrack(self, part_obj, vs, system_key, panel_count,
+                           slides_right):
         if not self._hasChild(part_obj, "SliderTrack"):
             self._addChild(
                 part_obj, "SliderTrack", SliderTrackChild,
@@ -434,14 +440,14 @@ class SlidingDoorAssembly(AssemblyController):
         if child is None:
             return
 
-        track_length = _calculateTrackLength(vs)
+        track_length = _calculateTrackLength(vs, panel_count)
         child.SliderSystem = system_key
         child.TrackLength = track_length
         track_x_offset = vs.TrackXOffset if hasattr(vs, "TrackXOffset") else 0
         has_override = hasattr(vs, "TrackWidthOverride") and vs.TrackWidthOverride.Value > 0
         if has_override:
             track_x = track_x_offset
-        elif vs.SlideDirection == "Right":
+        elif slides_right:
             track_x = track_x_offset
         else:
             track_x = -track_length/2 + track_x_offset
@@ -449,7 +455,7 @@ class SlidingDoorAssembly(AssemblyController):
         # Tube support bracket at fixed panel junction
         if hasattr(child, "TubeSupportX"):
             width = vs.Width.Value
-            if vs.SlideDirection == "Right":
+            if slides_right:
                 child.TubeSupportX = width - 50
             else:
                 child.TubeSupportX = track_length / 2 + 50
@@ -483,7 +489,7 @@ class SlidingDoorAssembly(AssemblyController):
     # Floor guide
     # ------------------------------------------------------------------
 
-    def _updateSliderFloorGuide(self, part_obj, vs, system_key):
+    def _updateSliderFloorGuide(self, part_obj, vs, slides_right):
         if not self._hasChild(part_obj, "SliderFloorGuide"):
             self._addChild(
                 part_obj, "SliderFloorGuide", SliderFloorGuideChild,
@@ -497,7 +503,7 @@ class SlidingDoorAssembly(AssemblyController):
         thickness = vs.Thickness.Value
         guide_w = FLOOR_GUIDE_SPECS["width"]
 
-        if vs.SlideDirection == "Right":
+        if slides_right:
             x_pos = vs.Width.Value - FLOOR_GUIDE_SPECS["length"]
         else:
             x_pos = 0
@@ -512,7 +518,8 @@ class SlidingDoorAssembly(AssemblyController):
     # Rollers
     # ------------------------------------------------------------------
 
-    def _updateSliderRollers(self, part_obj, vs, system_key, panel_count):
+    def _updateSliderRollers(self, part_obj, vs, system_key, panel_count,
+                             slides_right):
         roller_count = panel_count * 2
         self._syncChildCount(
             part_obj, "SliderRoller", roller_count, SliderRollerChild,
@@ -531,7 +538,7 @@ class SlidingDoorAssembly(AssemblyController):
                 if system_key == "duplo":
                     hole_handle = dims["door_wheel_hole_from_handle_side"]
                     hole_fixed = dims["door_wheel_hole_from_fixed_side"]
-                    if vs.SlideDirection == "Right":
+                    if slides_right:
                         x_positions = [hole_handle, width - hole_fixed]
                     else:
                         x_positions = [hole_fixed, width - hole_handle]
@@ -610,17 +617,9 @@ class SlidingDoorAssembly(AssemblyController):
     # ------------------------------------------------------------------
 
     def _validateSliderSystem(self, vs, system_key):
-        from freecad.ShowerDesigner.Data.HardwareSpecs import validateSliderSystem
-
         width = vs.Width.Value
         thickness = vs.Thickness.Value
-
-        area = (width / 1000.0) * (vs.Height.Value / 1000.0)
-        thickness_key = f"{int(thickness)}mm"
-        if thickness_key in GLASS_SPECS:
-            weight = area * GLASS_SPECS[thickness_key]["weight_kg_m2"]
-        else:
-            weight = area * 2.5 * thickness
+        _, weight = _calculateGlassMetrics(width, vs.Height.Value, thickness)
 
         valid, msg = validateSliderSystem(system_key, width, weight, thickness)
         if hasattr(vs, "SystemValidation"):
@@ -632,57 +631,36 @@ class SlidingDoorAssembly(AssemblyController):
     # Calculated properties
     # ------------------------------------------------------------------
 
-    def _updateCalculatedProperties(self, vs):
+    def _updateCalculatedProperties(self, vs, panel_count):
+        width = vs.Width.Value
+        overlap = vs.OverlapWidth.Value
+        system_key = vs.SliderSystem
+
+        area, weight = _calculateGlassMetrics(
+            width, vs.Height.Value, vs.Thickness.Value
+        )
+        track_length = _calculateTrackLength(vs, panel_count)
+        track_height = _calculateTrackHeight(system_key)
+
+        # Travel distance & opening width
+        if panel_count == 1:
+            travel = width
+        else:
+            travel = width - overlap
+
         try:
-            width = vs.Width.Value
-            height = vs.Height.Value
-            thickness = vs.Thickness.Value
-            panel_count = max(1, min(2, vs.PanelCount))
-            overlap = vs.OverlapWidth.Value
-
-            # Glass weight & area
-            width_m = width / 1000.0
-            height_m = height / 1000.0
-            area = width_m * height_m
             if hasattr(vs, "Area"):
                 vs.Area = area
-
-            thickness_key = f"{int(thickness)}mm"
-            if thickness_key in GLASS_SPECS:
-                weight_per_m2 = GLASS_SPECS[thickness_key]["weight_kg_m2"]
-                weight = area * weight_per_m2
-            else:
-                weight = area * 2.5 * thickness
             if hasattr(vs, "Weight"):
                 vs.Weight = weight
-
-            # Track length
-            track_length = _calculateTrackLength(vs)
             if hasattr(vs, "TrackLength"):
                 vs.TrackLength = track_length
-
-            # Track height
-            system_key = vs.SliderSystem
-            spec = SLIDER_SYSTEM_SPECS.get(system_key)
-            if spec and hasattr(vs, "TrackHeight"):
-                dims = spec["dimensions"]
-                if system_key == "duplo":
-                    vs.TrackHeight = dims["tube_diameter"]
-                else:
-                    vs.TrackHeight = dims["track_height"]
-
-            # Travel distance & opening width
-            if panel_count == 1:
-                travel = width
-                opening = width
-            else:
-                travel = width - overlap
-                opening = width - overlap
+            if track_height is not None and hasattr(vs, "TrackHeight"):
+                vs.TrackHeight = track_height
             if hasattr(vs, "TravelDistance"):
                 vs.TravelDistance = travel
             if hasattr(vs, "OpeningWidth"):
-                vs.OpeningWidth = opening
-
+                vs.OpeningWidth = travel
         except Exception as e:
             App.Console.PrintWarning(
                 f"Error updating calculated properties: {e}\n"
@@ -696,14 +674,50 @@ class SlidingDoorAssembly(AssemblyController):
 # Helpers
 # ======================================================================
 
-def _calculateTrackLength(vs):
-    """Calculate total track length based on panel configuration."""
+def _calculateGlassMetrics(width, height, thickness):
+    """Return (area in m², weight in kg) for a door panel."""
+    area = (width / 1000.0) * (height / 1000.0)
+    thickness_key = f"{int(thickness)}mm"
+    if thickness_key in GLASS_SPECS:
+        return area, area * GLASS_SPECS[thickness_key]["weight_kg_m2"]
+    return area, area * 2.5 * thickness
+
+
+def _calculateTrackHeight(system_key):
+    """Return the track profile height for a slider system, or None if unknown."""
+    spec = SLIDER_SYSTEM_SPECS.get(system_key)
+    if spec is None:
+        return None
+    dims = spec["dimensions"]
+    if system_key == "duplo":
+        return dims["tube_diameter"]
+    return dims["track_height"]
+
+
+def _clampPanelCount(panel_count):
+    """Clamp a raw PanelCount value to the supported range (1 or 2)."""
+    return 1 if panel_count < 2 else 2
+
+
+def _clampHandleHeight(handle_height, door_height):
+    """Keep the handle at least 100 mm below the top of the door."""
+    return min(handle_height, door_height - 100)
+
+
+def _calculateTrackLength(vs, panel_count=None):
+    """Calculate total track length based on panel configuration.
+
+    Args:
+        vs: The assembly VarSet
+        panel_count: Clamped panel count; read from the VarSet when omitted
+    """
     override = vs.TrackWidthOverride.Value if hasattr(vs, "TrackWidthOverride") else 0
     if override > 0:
         return override
 
     width = vs.Width.Value
-    panel_count = max(1, min(2, vs.PanelCount))
+    if panel_count is None:
+        panel_count = _clampPanelCount(vs.PanelCount)
     clearance = 0
 
     if panel_count == 1:
@@ -738,5 +752,5 @@ def createSlidingDoor(name="SlidingDoor"):
     SlidingDoorAssembly(part)
 
     doc.recompute()
-    App.Console.PrintMessage(f"Sliding door '{name}' created\n")
+    App.Console.PrintLog(f"Sliding door '{name}' created\n")
     return part
@@ -8,6 +8,8 @@ Provides a SupportBar Part::FeaturePython object and a shared
 createSupportBarShape() function.
 """
 
+from functools import lru_cache
+
 import FreeCAD as App
 import Part
 from freecad.ShowerDesigner.Data.HardwareSpecs import (
@@ -15,6 +17,9 @@ from freecad.ShowerDesigner.Data.HardwareSpecs import (
     HARDWARE_FINISHES,
 )
 
+_BAR_TYPES = tuple(SUPPORT_BAR_SPECS)
+_ZAXIS = App.Vector(0, 0, 1)
+
 
 def createSupportBarShape(bar_type, length, diameter):
     """
@@ -28,6 +33,15 @@ def createSupportBarShape(bar_type, length, diameter):
     Returns:
         Part.Shape: Cylinder representing the bar
     """
+    return _cachedSupportBarShape(bar_type, length, diameter).copy()
+
+
+@lru_cache(maxsize=32)
+def _cachedSupportBarShape(bar_type, length, diameter):
+    """Build the bar cylinder once per (type, length, diameter).
+
+    Callers must copy the result; the cached shape is shared.
+    """
     radius = diameter / 2
 
     if bar_type == "Vertical" or bar_type == "Ceiling":
@@ -53,7 +67,10 @@ class SupportBar:
         Finish: Hardware finish
     """
 
+    __slots__ = ("_validating",)
+
     def __init__(self, obj):
+        self._validating = False
         obj.Proxy = self
 
         obj.addProperty(
@@ -62,7 +79,7 @@ class SupportBar:
             "Support Bar",
             "Type of support bar"
         )
-        obj.BarType = list(SUPPORT_BAR_SPECS.keys())
+        obj.BarType = _BAR_TYPES
         obj.BarType = "Horizontal"
 
         obj.addProperty(
@@ -85,7 +102,7 @@ class SupportBar:
             "Support Bar",
             "Hardware finish"
         )
-        obj.Finish = HARDWARE_FINISHES[:]
+        obj.Finish = HARDWARE_FINISHES
         obj.Finish = "Chrome"
 
         obj.addProperty(
@@ -113,24 +130,36 @@ class SupportBar:
         shape = createSupportBarShape(obj.BarType, length, diameter)
         obj.Shape = shape
 
-        obj.Placement.Base = obj.Position
-        obj.Placement.Rotation = App.Rotation(App.Vector(0, 0, 1), obj.Rotation)
+        # Only touch the placement when it actually differs; the common case
+        # is an unrotated bar that has not moved since the last recompute.
+        if not obj.Placement.Base.isEqual(obj.Position, 1e-9):
+            obj.Placement.Base = obj.Position
+        if obj.Rotation.Value != 0.0 or obj.Placement.Rotation.Angle != 0.0:
+            obj.Placement.Rotation = App.Rotation(_ZAXIS, obj.Rotation)
 
     def onChanged(self, obj, prop):
+        # Corrective writes below re-enter onChanged; ignore those calls
+        if self._validating:
+            return
         if prop == "Diameter":
             if hasattr(obj, "Diameter") and hasattr(obj, "BarType"):
                 spec = SUPPORT_BAR_SPECS.get(obj.BarType)
                 if spec:
                     min_d, max_d = spec["diameter_range"]
-                    if obj.Diameter.Value < min_d:
-                        obj.Diameter = min_d
-                    elif obj.Diameter.Value > max_d:
-                        obj.Diameter = max_d
+                    diameter = obj.Diameter.Value
+                    clamped = min(max(diameter, min_d), max_d)
+                    if clamped != diameter:
+                        self._validating = True
+                        try:
+                            obj.Diameter = clamped
+                        finally:
+                            self._validating = False
 
     def __getstate__(self):
         return None
 
     def __setstate__(self, state):
+        self._validating = False
         return None
 
 
@@ -155,5 +184,5 @@ def createSupportBar(name="SupportBar"):
         obj.ViewObject.Proxy = 0
 
     doc.recompute()
-    App.Console.PrintMessage(f"Support bar '{name}' created\n")
+    App.Console.PrintLog(f"Support bar '{name}' created\n")
     return obj
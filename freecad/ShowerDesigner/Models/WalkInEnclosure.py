@@ -15,7 +15,6 @@ Configurations:
 import math
 
 import FreeCAD as App
-import Part
 from freecad.ShowerDesigner.Models.AssemblyBase import AssemblyController
 from freecad.ShowerDesigner.Models.ChildProxies import (
     SupportBarChild,
@@ -42,6 +41,63 @@ def _setupGlassVP(obj):
     setupViewProvider(obj)
 
 
+_GLASS_TYPES = ("Clear", "Frosted", "Bronze", "Grey", "Reeded", "Low-Iron")
+
+# Panel orientations about Z. App.Placement copies its rotation, so these
+# are shared instead of being rebuilt on every recompute.
+_NO_ROTATION = App.Rotation()
+_QUARTER_TURN = App.Rotation(App.Vector(0, 0, 1), 90)
+
+# (type, name, group, tooltip, default) for each VarSet property, in
+# property-editor order. Enumerations use (choices, default) as the default.
+_VARSET_PROPERTIES = (
+    # Layout
+    ("App::PropertyEnumeration", "PanelConfiguration", "Layout",
+     "Panel arrangement",
+     (("Single", "Double-L", "Double-Parallel", "Double-Inline"), "Single")),
+    ("App::PropertyEnumeration", "LJointSide", "Layout",
+     "Which end of Panel 1 the L-joint panel attaches to",
+     (("Left", "Right"), "Left")),
+    # Dimensions
+    ("App::PropertyLength", "Width", "Dimensions",
+     "Width of the glass panel", 1000),
+    ("App::PropertyLength", "Height", "Dimensions",
+     "Height of the enclosure", 2000),
+    ("App::PropertyLength", "Depth", "Dimensions",
+     "Depth for Double-L arm, Double-Parallel gap, or Double-Inline walk-in gap",
+     900),
+    ("App::PropertyLength", "GlassThickness", "Glass",
+     "Thickness of glass panel", 10),
+    # Glass
+    ("App::PropertyEnumeration", "GlassType", "Glass",
+     "Type of glass", (_GLASS_TYPES, "Clear")),
+    # Support bar
+    ("App::PropertyBool", "ShowSupportBar", "Support Bar",
+     "Add support bar", True),
+    ("App::PropertyEnumeration", "SupportBarType", "Support Bar",
+     "Type of support bar", (tuple(SUPPORT_BAR_SPECS), "Horizontal")),
+    ("App::PropertyLength", "SupportBarHeight", "Support Bar",
+     "Height of support bar from floor", 2000),
+    ("App::PropertyLength", "SupportBarDiameter", "Support Bar",
+     "Diameter of support bar", 19),
+    ("App::PropertyLength", "SupportBarInset", "Support Bar",
+     "Distance from free panel edge for perpendicular bar (Double-L)", 75),
+    # Glass shelf
+    ("App::PropertyBool", "ShowGlassShelf", "Glass Shelf",
+     "Add a glass shelf", False),
+    ("App::PropertyEnumeration", "ShelfPosition", "Glass Shelf",
+     "Where to place the shelf", (("Position 1", "Position 2"), "Position 1")),
+    ("App::PropertyLength", "ShelfHeightFromFloor", "Glass Shelf",
+     "Height of shelf from floor", GLASS_SHELF_SPECS["default_height_from_floor"]),
+    ("App::PropertyLength", "ShelfWidth", "Glass Shelf",
+     "Shelf extent along edge 1", GLASS_SHELF_SPECS["default_width"]),
+    ("App::PropertyLength", "ShelfDepth", "Glass Shelf",
+     "Shelf extent along edge 2", GLASS_SHELF_SPECS["default_depth"]),
+    # Hardware display
+    ("App::PropertyEnumeration", "HardwareFinish", "Hardware Display",
+     "Finish for all hardware", (HARDWARE_FINISHES, "Chrome")),
+)
+
 
 class WalkInEnclosureAssembly(AssemblyController):
     """
@@ -53,108 +109,31 @@ class WalkInEnclosureAssembly(AssemblyController):
       - Optional SupportBar child(ren)
     """
 
+    # Runtime caches, none of them serialized (a restored document always
+    # runs one full execute):
+    #   _nestedVarSets -- nested assembly name -> VarSet name, filled lazily
+    #   _lastFinish    -- finish last pushed to the hardware ViewProviders
+    __slots__ = ("_nestedVarSets", "_lastFinish")
+
     def __init__(self, part_obj):
+        self._resetCaches()
         super().__init__(part_obj)
         vs = self._getOrCreateVarSet(part_obj)
         self._setupVarSetProperties(vs)
         self._ensurePanel(part_obj, "Panel")
         self._manifest["_panelConfig"] = "Single"
 
-    def _setupVarSetProperties(self, vs):
-        # Layout
-        vs.addProperty(
-            "App::PropertyEnumeration", "PanelConfiguration", "Layout",
-            "Panel arrangement"
-        )
-        vs.PanelConfiguration = ["Single", "Double-L", "Double-Parallel", "Double-Inline"]
-        vs.PanelConfiguration = "Single"
-        vs.addProperty(
-            "App::PropertyEnumeration", "LJointSide", "Layout",
-            "Which end of Panel 1 the L-joint panel attaches to"
-        )
-        vs.LJointSide = ["Left", "Right"]
-        vs.LJointSide = "Left"
-
-        # Dimensions
-        vs.addProperty(
-            "App::PropertyLength", "Width", "Dimensions",
-            "Width of the glass panel"
-        ).Width = 1000
-        vs.addProperty(
-            "App::PropertyLength", "Height", "Dimensions",
-            "Height of the enclosure"
-        ).Height = 2000
-        vs.addProperty(
-            "App::PropertyLength", "Depth", "Dimensions",
-            "Depth for Double-L arm, Double-Parallel gap, or Double-Inline walk-in gap"
-        ).Depth = 900
-        vs.addProperty(
-            "App::PropertyLength", "GlassThickness", "Glass",
-            "Thickness of glass panel"
-        ).GlassThickness = 10
-
-        # Glass
-        vs.addProperty(
-            "App::PropertyEnumeration", "GlassType", "Glass", "Type of glass"
-        )
-        vs.GlassType = ["Clear", "Frosted", "Bronze", "Grey", "Reeded", "Low-Iron"]
-        vs.GlassType = "Clear"
-
-        # Support bar
-        vs.addProperty(
-            "App::PropertyBool", "ShowSupportBar", "Support Bar",
-            "Add support bar"
-        ).ShowSupportBar = True
-        vs.addProperty(
-            "App::PropertyEnumeration", "SupportBarType", "Support Bar",
-            "Type of support bar"
-        )
-        vs.SupportBarType = list(SUPPORT_BAR_SPECS.keys())
-        vs.SupportBarType = "Horizontal"
-        vs.addProperty(
-            "App::PropertyLength", "SupportBarHeight", "Support Bar",
-            "Height of support bar from floor"
-        ).SupportBarHeight = 2000
-        vs.addProperty(
-            "App::PropertyLength", "SupportBarDiameter", "Support Bar",
-            "Diameter of support bar"
-        ).SupportBarDiameter = 19
-        vs.addProperty(
-            "App::PropertyLength", "SupportBarInset", "Support Bar",
-            "Distance from free panel edge for perpendicular bar (Double-L)"
-        ).SupportBarInset = 75
+    def _resetCaches(self):
+        self._nestedVarSets = {}
+        self._lastFinish = None
 
-        # Glass shelf
-        vs.addProperty(
-            "App::PropertyBool", "ShowGlassShelf", "Glass Shelf",
-            "Add a glass shelf"
-        ).ShowGlassShelf = False
-        vs.addProperty(
-            "App::PropertyEnumeration", "ShelfPosition", "Glass Shelf",
-            "Where to place the shelf"
-        )
-        vs.ShelfPosition = ["Position 1", "Position 2"]
-        vs.ShelfPosition = "Position 1"
-        vs.addProperty(
-            "App::PropertyLength", "ShelfHeightFromFloor", "Glass Shelf",
-            "Height of shelf from floor"
-        ).ShelfHeightFromFloor = GLASS_SHELF_SPECS["default_height_from_floor"]
-        vs.addProperty(
-            "App::PropertyLength", "ShelfWidth", "Glass Shelf",
-            "Shelf extent along edge 1"
-        ).ShelfWidth = GLASS_SHELF_SPECS["default_width"]
-        vs.addProperty(
-            "App::PropertyLength", "ShelfDepth", "Glass Shelf",
-            "Shelf extent along edge 2"
-        ).ShelfDepth = GLASS_SHELF_SPECS["default_depth"]
-
-        # Hardware display
-        vs.addProperty(
-            "App::PropertyEnumeration", "HardwareFinish", "Hardware Display",
-            "Finish for all hardware"
-        )
-        vs.HardwareFinish = HARDWARE_FINISHES[:]
-        vs.HardwareFinish = "Chrome"
+    def _setupVarSetProperties(self, vs):
+        for prop_type, name, group, tooltip, default in _VARSET_PROPERTIES:
+            vs.addProperty(prop_type, name, group, tooltip)
+            if prop_type == "App::PropertyEnumeration":
+                choices, default = default
+                setattr(vs, name, list(choices))
+            setattr(vs, name, default)
 
     # ------------------------------------------------------------------
     # Layout management
@@ -169,6 +148,7 @@ class WalkInEnclosureAssembly(AssemblyController):
         obj = doc.getObject(name)
         if obj is None:
             return
+        self._nestedVarSets.pop(name, None)
         for child in list(obj.Group):
             obj.removeObject(child)
             doc.removeObject(child.Name)
@@ -220,23 +200,41 @@ class WalkInEnclosureAssembly(AssemblyController):
     # Helpers
     # ------------------------------------------------------------------
 
-    def _propagateToPanel(self, panel, vs, panel_width):
-        """Propagate VarSet values to a nested FixedPanel assembly."""
+    def _propagateToPanel(self, panel, panel_width, height, thickness,
+                          glass_type, finish):
+        """Propagate enclosure values to a nested FixedPanel assembly.
+
+        Only properties whose value differs are written, so an unchanged
+        value does not mark the nested VarSet as touched.
+        """
         panel_vs = self._getNestedVarSet(panel)
         if panel_vs is None:
             return
-        panel_vs.Width = panel_width
-        panel_vs.Height = vs.Height.Value
-        panel_vs.Thickness = vs.GlassThickness.Value
-        if hasattr(panel_vs, "GlassType"):
-            panel_vs.GlassType = vs.GlassType
-        if hasattr(panel_vs, "HardwareFinish"):
-            panel_vs.HardwareFinish = vs.HardwareFinish
+        if panel_vs.Width.Value != panel_width:
+            panel_vs.Width = panel_width
+        if panel_vs.Height.Value != height:
+            panel_vs.Height = height
+        if panel_vs.Thickness.Value != thickness:
+            panel_vs.Thickness = thickness
+        if hasattr(panel_vs, "GlassType") and panel_vs.GlassType != glass_type:
+            panel_vs.GlassType = glass_type
+        if hasattr(panel_vs, "HardwareFinish") and panel_vs.HardwareFinish != finish:
+            panel_vs.HardwareFinish = finish
 
     def _getNestedVarSet(self, part_obj):
-        """Get VarSet from a nested assembly."""
+        """Get VarSet from a nested assembly.
+
+        The first lookup scans the nested Group; later lookups resolve the
+        remembered name directly.
+        """
+        name = self._nestedVarSets.get(part_obj.Name)
+        if name is not None:
+            vs = part_obj.Document.getObject(name)
+            if vs is not None:
+                return vs
         for child in part_obj.Group:
             if child.TypeId == "App::VarSet":
+                self._nestedVarSets[part_obj.Name] = child.Name
                 return child
         return None
 
@@ -259,58 +257,65 @@ class WalkInEnclosureAssembly(AssemblyController):
             App.Console.PrintError("Invalid enclosure dimensions\n")
             return
 
+        if vs.ShowSupportBar and (vs.SupportBarDiameter.Value <= 0
+                                  or vs.SupportBarHeight.Value <= 0):
+            App.Console.PrintError("Invalid support bar dimensions\n")
+            return
+
         # Rebuild panels if configuration changed
         self._ensureLayout(part_obj, vs)
 
         config = getattr(vs, "PanelConfiguration", "Single")
         l_side = getattr(vs, "LJointSide", "Left")
         finish = vs.HardwareFinish
+        # Shared by every nested panel: (height, thickness, glass type, finish)
+        panel_inputs = (height, thickness, vs.GlassType, finish)
 
         if config == "Single":
             panel = self._getChild(part_obj, "Panel")
             if panel:
-                self._propagateToPanel(panel, vs, width)
+                self._propagateToPanel(panel, width, *panel_inputs)
                 panel.Placement = App.Placement(
                     App.Vector(0, 0, 0),
-                    App.Rotation(App.Vector(0, 0, 1), 0),
+                    _NO_ROTATION,
                 )
 
         elif config == "Double-L":
             panel1 = self._getChild(part_obj, "Panel1")
             panel2 = self._getChild(part_obj, "Panel2")
             if panel1:
-                self._propagateToPanel(panel1, vs, width)
+                self._propagateToPanel(panel1, width, *panel_inputs)
                 panel1.Placement = App.Placement(
                     App.Vector(0, 0, 0),
-                    App.Rotation(App.Vector(0, 0, 1), 0),
+                    _NO_ROTATION,
                 )
             if panel2:
-                self._propagateToPanel(panel2, vs, depth)
+                self._propagateToPanel(panel2, depth, *panel_inputs)
                 if l_side == "Left":
                     panel2.Placement = App.Placement(
                         App.Vector(0, thickness, 0),
-                        App.Rotation(App.Vector(0, 0, 1), 90),
+                        _QUARTER_TURN,
                     )
                 else:
                     panel2.Placement = App.Placement(
                         App.Vector(width, thickness, 0),
-                        App.Rotation(App.Vector(0, 0, 1), 90),
+                        _QUARTER_TURN,
                     )
 
         elif config == "Double-Parallel":
             panel1 = self._getChild(part_obj, "Panel1")
             panel2 = self._getChild(part_obj, "Panel2")
             if panel1:
-                self._propagateToPanel(panel1, vs, width)
+                self._propagateToPanel(panel1, width, *panel_inputs)
                 panel1.Placement = App.Placement(
                     App.Vector(0, 0, 0),
-                    App.Rotation(App.Vector(0, 0, 1), 0),
+                    _NO_ROTATION,
                 )
             if panel2:
-                self._propagateToPanel(panel2, vs, width)
+                self._propagateToPanel(panel2, width, *panel_inputs)
                 panel2.Placement = App.Placement(
                     App.Vector(0, depth, 0),
-                    App.Rotation(App.Vector(0, 0, 1), 0),
+                    _NO_ROTATION,
                 )
 
         elif config == "Double-Inline":
@@ -318,19 +323,20 @@ class WalkInEnclosureAssembly(AssemblyController):
             panel1 = self._getChild(part_obj, "Panel1")
             panel2 = self._getChild(part_obj, "Panel2")
             if panel1:
-                self._propagateToPanel(panel1, vs, width)
+                self._propagateToPanel(panel1, width, *panel_inputs)
                 panel1.Placement = App.Placement(
                     App.Vector(0, 0, 0),
-                    App.Rotation(App.Vector(0, 0, 1), 0),
+                    _NO_ROTATION,
                 )
             if panel2:
-                self._propagateToPanel(panel2, vs, width)
+                self._propagateToPanel(panel2, width, *panel_inputs)
                 panel2_vs = self._getNestedVarSet(panel2)
-                if panel2_vs and hasattr(panel2_vs, "WallMountEdge"):
+                if (panel2_vs and hasattr(panel2_vs, "WallMountEdge")
+                        and panel2_vs.WallMountEdge != "Right"):
                     panel2_vs.WallMountEdge = "Right"
                 panel2.Placement = App.Placement(
                     App.Vector(width + depth, 0, 0),
-                    App.Rotation(App.Vector(0, 0, 1), 0),
+                    _NO_ROTATION,
                 )
 
         # Support bars
@@ -353,61 +359,77 @@ class WalkInEnclosureAssembly(AssemblyController):
                 self._removeChild(part_obj, "GlassShelf")
             self._syncChildCount(part_obj, "ShelfClamp", 0, ClampChild)
 
-        self._updateAllHardwareFinish(part_obj, finish)
+        # Hardware children are created with the current finish, so existing
+        # ViewProviders only need repainting when the finish itself changes
+        if finish != self._lastFinish:
+            self._updateAllHardwareFinish(part_obj, finish)
+            self._lastFinish = finish
 
     # ------------------------------------------------------------------
     # Support bars
     # ------------------------------------------------------------------
 
-    def _ensureSupportBar(self, part_obj, vs, role):
+    def _ensureSupportBar(self, part_obj, finish, role):
         """Create a support bar child if it doesn't exist."""
         if not self._hasChild(part_obj, role):
             self._addChild(
                 part_obj, role, SupportBarChild,
-                lambda obj: _setupHardwareVP(obj, vs.HardwareFinish),
+                lambda obj: _setupHardwareVP(obj, finish),
             )
         return self._getChild(part_obj, role)
 
+    @staticmethod
+    def _applySupportBar(bar, bar_type, length, diameter, position):
+        """Write support bar properties, skipping values that already match.
+
+        This only avoids redundant property writes; the bar shape is still
+        rebuilt on every execute by _recomputeChildren.
+        """
+        if bar.BarType != bar_type:
+            bar.BarType = bar_type
+        if bar.Length.Value != length:
+            bar.Length = length
+        if bar.Diameter.Value != diameter:
+            bar.Diameter = diameter
+        placement = bar.Placement
+        if (not placement.Base.isEqual(position, 1e-7)
+                or placement.Rotation.Angle != 0.0):
+            bar.Placement = App.Placement(position, _NO_ROTATION)
+
     def _updateSupportBars(self, part_obj, vs, config, width, depth, height,
                            thickness, l_side="Left"):
+        finish = vs.HardwareFinish
+        bar_type = vs.SupportBarType
         bar_height = vs.SupportBarHeight.Value
+        bar_diam = vs.SupportBarDiameter.Value
         inset = vs.SupportBarInset.Value
 
         if config == "Double-L":
             # Single perpendicular bar on Panel 1 only (like CornerEnclosure).
             # Sits at top edge of glass, inset 75 mm from the free corner,
             # runs perpendicular to Panel 1 toward the back wall.
-            bar1 = self._ensureSupportBar(part_obj, vs, "SupportBar")
+            bar1 = self._ensureSupportBar(part_obj, finish, "SupportBar")
             if bar1:
-                bar1.BarType = vs.SupportBarType
-                bar1.Length = depth - thickness
-                bar1.Diameter = vs.SupportBarDiameter.Value
                 if l_side == "Left":
                     # Panel 2 at x=0; free edge of Panel 1 at x=width
-                    bar1.Placement = App.Placement(
-                        App.Vector(width - inset, thickness / 2, height),
-                        App.Rotation(App.Vector(0, 0, 1), 0),
-                    )
+                    position = App.Vector(width - inset, thickness / 2, height)
                 else:
                     # Panel 2 at x=width; free edge of Panel 1 at x=0
-                    bar1.Placement = App.Placement(
-                        App.Vector(inset, thickness / 2, height),
-                        App.Rotation(App.Vector(0, 0, 1), 0),
-                    )
+                    position = App.Vector(inset, thickness / 2, height)
+                self._applySupportBar(
+                    bar1, bar_type, depth - thickness, bar_diam, position,
+                )
             # No second bar for Double-L
             if self._hasChild(part_obj, "SupportBar2"):
                 self._removeChild(part_obj, "SupportBar2")
 
         else:
             # Single / Double-Parallel / Double-Inline: horizontal bar along panel top
-            bar1 = self._ensureSupportBar(part_obj, vs, "SupportBar")
+            bar1 = self._ensureSupportBar(part_obj, finish, "SupportBar")
             if bar1:
-                bar1.BarType = vs.SupportBarType
-                bar1.Length = width
-                bar1.Diameter = vs.SupportBarDiameter.Value
-                bar1.Placement = App.Placement(
+                self._applySupportBar(
+                    bar1, bar_type, width, bar_diam,
                     App.Vector(width - inset, thickness / 2, bar_height),
-                    App.Rotation(App.Vector(0, 0, 1), 0),
                 )
 
             if config == "Single":
@@ -415,25 +437,19 @@ class WalkInEnclosureAssembly(AssemblyController):
                     self._removeChild(part_obj, "SupportBar2")
 
             elif config == "Double-Parallel":
-                bar2 = self._ensureSupportBar(part_obj, vs, "SupportBar2")
+                bar2 = self._ensureSupportBar(part_obj, finish, "SupportBar2")
                 if bar2:
-                    bar2.BarType = vs.SupportBarType
-                    bar2.Length = width
-                    bar2.Diameter = vs.SupportBarDiameter.Value
-                    bar2.Placement = App.Placement(
+                    self._applySupportBar(
+                        bar2, bar_type, width, bar_diam,
                         App.Vector(width - inset, depth + thickness / 2, bar_height),
-                        App.Rotation(App.Vector(0, 0, 1), 0),
                     )
 
             elif config == "Double-Inline":
-                bar2 = self._ensureSupportBar(part_obj, vs, "SupportBar2")
+                bar2 = self._ensureSupportBar(part_obj, finish, "SupportBar2")
                 if bar2:
-                    bar2.BarType = vs.SupportBarType
-                    bar2.Length = width
-                    bar2.Diameter = vs.SupportBarDiameter.Value
-                    bar2.Placement = App.Placement(
+                    self._applySupportBar(
+                        bar2, bar_type, width, bar_diam,
                         App.Vector(width + depth + inset, thickness / 2, bar_height),
-                        App.Rotation(App.Vector(0, 0, 1), 0),
                     )
 
     # ------------------------------------------------------------------
@@ -699,6 +715,10 @@ class WalkInEnclosureAssembly(AssemblyController):
     def assemblyOnChanged(self, part_obj, prop):
         pass
 
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._resetCaches()
+
 
 # ======================================================================
 # Factory function
@@ -722,5 +742,5 @@ def createWalkInEnclosure(name="WalkInEnclosure"):
     WalkInEnclosureAssembly(part)
 
     doc.recompute()
-    App.Console.PrintMessage(f"Walk-in enclosure '{name}' created\n")
+    App.Console.PrintLog(f"Walk-in enclosure '{name}' created\n")
     return part
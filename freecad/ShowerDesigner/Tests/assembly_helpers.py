@@ -0,0 +1,65 @@
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# SPDX-FileNotice: Part of the ShowerDesigner workbench.
+
+"""
+Helpers shared by the FreeCAD assembly test modules.
+
+Plain functions with no pytest dependency, so the modules that run from
+FreeCAD's Python console can use them as well.
+"""
+
+import traceback
+
+import FreeCAD as App
+
+
+def get_varset(part_obj):
+    """Find the VarSet child inside an assembly."""
+    for child in part_obj.Group:
+        if child.TypeId == "App::VarSet":
+            return child
+    return None
+
+
+def group_index(part_obj):
+    """Map each child role (Label without its numeric suffix) to its objects.
+
+    Built once per check so several role lookups share a single pass over
+    the Group instead of rescanning it per prefix.
+    """
+    index = {}
+    for child in part_obj.Group:
+        index.setdefault(child.Label.rstrip("0123456789"), []).append(child)
+    return index
+
+
+def makeDoc(name):
+    """Throwaway hidden document, so each test recomputes only its objects."""
+    doc = App.newDocument(name, hidden=True)
+    App.setActiveDocument(doc.Name)
+    return doc
+
+
+def closeDoc(doc, type_counts=None):
+    """Close a test document, first tallying its TypeIds into type_counts."""
+    if type_counts is not None:
+        type_counts.update(o.TypeId for o in doc.Objects)
+    App.closeDocument(doc.Name)
+
+
+def run_test(test, *args, failures=None):
+    """Run one test for a console runner; return True if it passed.
+
+    Tracebacks are appended to *failures* as (test name, traceback) when a
+    list is given, to be printed after the run, otherwise printed at once.
+    """
+    try:
+        test(*args)
+    except Exception as e:
+        print(f"  FAIL: {e}")
+        if failures is None:
+            traceback.print_exc()
+        else:
+            failures.append((test.__name__, traceback.format_exc()))
+        return False
+    return True
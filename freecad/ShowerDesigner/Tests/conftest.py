@@ -0,0 +1,38 @@
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# SPDX-FileNotice: Part of the ShowerDesigner workbench.
+
+"""
+pytest configuration for the ShowerDesigner tests.
+
+Makes the ``freecad.ShowerDesigner`` package importable from a source
+checkout, wherever it lives, so the test modules no longer each insert a
+hard-coded install path, and registers the ``slow`` marker for tests that
+build full OCCT boolean geometry.
+
+When pytest is launched from FreeCAD's embedded interpreter (FreeCAD is
+already imported before any test module is collected), the last-failed /
+new-first bookkeeping is dropped so the session does not read and rewrite
+the .pytest_cache on every run.
+"""
+
+import sys
+from pathlib import Path
+
+# Directory that contains the top-level ``freecad`` package
+_SOURCE_ROOT = str(Path(__file__).resolve().parents[3])
+
+if _SOURCE_ROOT not in sys.path:
+    sys.path.insert(0, _SOURCE_ROOT)
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "slow: builds full OCCT boolean geometry; deselect with -m 'not slow'",
+    )
+    if "FreeCAD" not in sys.modules:
+        return
+    for name in ("lfplugin", "nfplugin"):
+        plugin = config.pluginmanager.get_plugin(name)
+        if plugin is not None:
+            config.pluginmanager.unregister(plugin)
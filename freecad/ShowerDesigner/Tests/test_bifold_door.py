@@ -4,28 +4,29 @@
 """
 Test script for BiFoldDoor assembly implementation.
 
-Run this in FreeCAD's Python console:
+Requires pytest, including when run from FreeCAD's Python console
+(install it into FreeCAD's Python first):
     exec(open('path/to/test_bifold_door.py').read())
-"""
-
-import sys
-sys.path.insert(
-    0, r"C:\Users\tclou\AppData\Roaming\FreeCAD\v1-1\Mod\ShowerDesigner"
-)
-
-import FreeCAD as App
-from freecad.ShowerDesigner.Models.BiFoldDoor import createBiFoldDoor
 
+Or via pytest (if FreeCAD modules are accessible):
+    pytest freecad/ShowerDesigner/Tests/test_bifold_door.py
+"""
 
-def _get_varset(part_obj):
-    for child in part_obj.Group:
-        if child.TypeId == "App::VarSet":
-            return child
-    return None
+import pytest
 
+# Skip the whole module under a plain Python without FreeCAD, rather than
+# aborting collection of the pure-data test modules alongside it
+App = pytest.importorskip("FreeCAD")
 
-def _get_children_by_prefix(part_obj, prefix):
-    return [c for c in part_obj.Group if c.Label.startswith(prefix)]
+from freecad.ShowerDesigner.Models.BiFoldDoor import createBiFoldDoor  # noqa: E402
+from freecad.ShowerDesigner.Models.ChildProxies import isHardwareChild  # noqa: E402
+from freecad.ShowerDesigner.Tests.assembly_helpers import (  # noqa: E402
+    closeDoc,
+    get_varset,
+    group_index,
+    makeDoc,
+    run_test,
+)
 
 
 def test_basic_creation():
@@ -34,20 +35,22 @@ def test_basic_creation():
     print("Test 1: Basic bi-fold door creation")
     print("=" * 70)
 
+    doc = makeDoc("BiFoldDoorTest")
     try:
         door = createBiFoldDoor("TestBiFold1")
         assert door.TypeId == "App::Part", f"Expected App::Part, got {door.TypeId}"
         print("  OK: Object is App::Part")
 
-        vs = _get_varset(door)
+        vs = get_varset(door)
         assert vs is not None, "VarSet not found"
         print("  OK: VarSet found")
 
-        wall_panels = _get_children_by_prefix(door, "WallPanel")
+        children = group_index(door)
+        wall_panels = children.get("WallPanel", [])
         assert len(wall_panels) == 1, f"Expected 1 WallPanel, got {len(wall_panels)}"
         print("  OK: WallPanel child found")
 
-        free_panels = _get_children_by_prefix(door, "FreePanel")
+        free_panels = children.get("FreePanel", [])
         assert len(free_panels) == 1, f"Expected 1 FreePanel, got {len(free_panels)}"
         print("  OK: FreePanel child found")
 
@@ -63,23 +66,21 @@ def test_basic_creation():
         assert vs.HingeCount == 2
         print("  OK: VarSet default properties correct")
 
-        wall_hinges = _get_children_by_prefix(door, "WallHinge")
+        wall_hinges = children.get("WallHinge", [])
         assert len(wall_hinges) == 2, f"Expected 2 WallHinge, got {len(wall_hinges)}"
         print("  OK: 2 wall hinge children created")
 
-        fold_hinges = _get_children_by_prefix(door, "FoldHinge")
+        fold_hinges = children.get("FoldHinge", [])
         assert len(fold_hinges) == 2, f"Expected 2 FoldHinge, got {len(fold_hinges)}"
         print("  OK: 2 fold hinge children created")
 
-        handles = _get_children_by_prefix(door, "Handle")
+        handles = children.get("Handle", [])
         assert len(handles) == 1, f"Expected 1 Handle, got {len(handles)}"
         print("  OK: Handle child created")
 
         print("  Status: PASSED")
-    except Exception as e:
-        print(f"  Status: FAILED - {e}")
-        import traceback
-        traceback.print_exc()
+    finally:
+        closeDoc(doc)
 
 
 def test_panel_width_calculation():
@@ -88,32 +89,24 @@ def test_panel_width_calculation():
     print("Test 2: Panel width calculation")
     print("=" * 70)
 
+    doc = makeDoc("BiFoldDoorTest")
     try:
-        door = createBiFoldDoor("TestPanelWidth")
-        vs = _get_varset(door)
-        vs.Width = 1000
-        App.ActiveDocument.recompute()
-
-        expected = 500
-        actual = vs.PanelWidth.Value
-        assert abs(actual - expected) < 0.01, (
-            f"Expected PanelWidth={expected}, got {actual}"
-        )
-        print(f"  Width=1000 -> PanelWidth={actual} - PASSED")
-
-        vs.Width = 800
-        App.ActiveDocument.recompute()
-        expected = 400
-        actual = vs.PanelWidth.Value
-        assert abs(actual - expected) < 0.01, (
-            f"Expected PanelWidth={expected}, got {actual}"
-        )
-        print(f"  Width=800 -> PanelWidth={actual} - PASSED")
-
-    except Exception as e:
-        print(f"  Status: FAILED - {e}")
-        import traceback
-        traceback.print_exc()
+        cases = [(1000, 500), (800, 400)]
+        varsets = []
+        for width, _ in cases:
+            vs = get_varset(createBiFoldDoor(f"TestPanelWidth{width}"))
+            vs.Width = width
+            varsets.append(vs)
+        doc.recompute()
+
+        for vs, (width, expected) in zip(varsets, cases):
+            actual = vs.PanelWidth.Value
+            assert abs(actual - expected) < 0.01, (
+                f"Expected PanelWidth={expected}, got {actual}"
+            )
+            print(f"  Width={width} -> PanelWidth={actual} - PASSED")
+    finally:
+        closeDoc(doc)
 
 
 def test_folded_width():
@@ -122,25 +115,25 @@ def test_folded_width():
     print("Test 3: Folded width")
     print("=" * 70)
 
+    doc = makeDoc("BiFoldDoorTest")
     try:
         door = createBiFoldDoor("TestFolded")
-        vs = _get_varset(door)
-        vs.Width = 900
-        vs.Thickness = 8
-        App.ActiveDocument.recompute()
+        vs = get_varset(door)
+        # Non-default inputs, so the values below come from this recompute
+        # and not from the factory's
+        vs.Width = 1000
+        vs.Thickness = 10
+        doc.recompute()
 
-        panel_width = 450
-        expected = panel_width + 8
+        panel_width = 500
+        expected = panel_width + 10
         actual = vs.FoldedWidth.Value
         assert abs(actual - expected) < 0.01, (
             f"Expected FoldedWidth={expected}, got {actual}"
         )
         print(f"  FoldedWidth={actual} (expected {expected}) - PASSED")
-
-    except Exception as e:
-        print(f"  Status: FAILED - {e}")
-        import traceback
-        traceback.print_exc()
+    finally:
+        closeDoc(doc)
 
 
 def test_opening_width():
@@ -149,25 +142,25 @@ def test_opening_width():
     print("Test 4: Opening width")
     print("=" * 70)
 
+    doc = makeDoc("BiFoldDoorTest")
     try:
         door = createBiFoldDoor("TestOpening")
-        vs = _get_varset(door)
-        vs.Width = 900
-        vs.Thickness = 8
-        App.ActiveDocument.recompute()
+        vs = get_varset(door)
+        # Non-default inputs, so the values below come from this recompute
+        # and not from the factory's
+        vs.Width = 1000
+        vs.Thickness = 10
+        doc.recompute()
 
-        folded_width = 450 + 8
-        expected = 900 - folded_width
+        folded_width = 500 + 10
+        expected = 1000 - folded_width
         actual = vs.OpeningWidth.Value
         assert abs(actual - expected) < 0.01, (
             f"Expected OpeningWidth={expected}, got {actual}"
         )
         print(f"  OpeningWidth={actual} (expected {expected}) - PASSED")
-
-    except Exception as e:
-        print(f"  Status: FAILED - {e}")
-        import traceback
-        traceback.print_exc()
+    finally:
+        closeDoc(doc)
 
 
 def test_clearance_depth():
@@ -176,87 +169,89 @@ def test_clearance_depth():
     print("Test 5: Clearance depth")
     print("=" * 70)
 
+    doc = makeDoc("BiFoldDoorTest")
     try:
         door = createBiFoldDoor("TestClearance")
-        vs = _get_varset(door)
-        vs.Width = 900
-        App.ActiveDocument.recompute()
+        vs = get_varset(door)
+        # Non-default inputs, so the values below come from this recompute
+        # and not from the factory's
+        vs.Width = 1000
+        vs.Thickness = 10
+        doc.recompute()
 
-        expected = 450
+        expected = 500
         actual = vs.ClearanceDepth.Value
         assert abs(actual - expected) < 0.01, (
             f"Expected ClearanceDepth={expected}, got {actual}"
         )
         print(f"  ClearanceDepth={actual} (expected {expected}) - PASSED")
+    finally:
+        closeDoc(doc)
 
-    except Exception as e:
-        print(f"  Status: FAILED - {e}")
-        import traceback
-        traceback.print_exc()
 
+_HINGE_CONFIGS = [
+    ("LeftHinge2", "Left", "Inward", 2),
+    ("RightHinge2", "Right", "Outward", 2),
+    ("LeftHinge3", "Left", "Inward", 3),
+]
 
-def test_hinge_configurations():
-    """Test 6: Different hinge/fold configurations."""
-    print("\n" + "=" * 70)
-    print("Test 6: Hinge configurations")
-    print("=" * 70)
+_HANDLE_TYPES = [
+    "None", "mushroom_knob_b2b", "pull_handle_round", "flush_handle_with_plate",
+]
 
-    configs = [
-        ("LeftHinge2", "Left", "Inward", 2),
-        ("RightHinge2", "Right", "Outward", 2),
-        ("LeftHinge3", "Left", "Inward", 3),
-    ]
 
-    for name, hinge_side, fold_direction, hinge_count in configs:
-        try:
-            door = createBiFoldDoor(name)
-            vs = _get_varset(door)
-            vs.HingeSide = hinge_side
-            vs.FoldDirection = fold_direction
-            vs.HingeCount = hinge_count
-            App.ActiveDocument.recompute()
-
-            fold_hinges = _get_children_by_prefix(door, "FoldHinge")
-            assert len(fold_hinges) == hinge_count, (
-                f"Expected {hinge_count} fold hinges, got {len(fold_hinges)}"
-            )
+@pytest.fixture(scope="module")
+def shared_door():
+    """One door reused by the parametrized tests; each case sets its inputs."""
+    doc = makeDoc("BiFoldDoorTest")
+    try:
+        yield createBiFoldDoor("SharedBiFold")
+    finally:
+        closeDoc(doc)
 
-            wall_hinges = _get_children_by_prefix(door, "WallHinge")
-            assert len(wall_hinges) == 2, (
-                f"Expected 2 wall hinges, got {len(wall_hinges)}"
-            )
 
-            print(f"  {name}: side={hinge_side}, fold hinges={hinge_count} - PASSED")
-        except Exception as e:
-            print(f"  {name}: FAILED - {e}")
+@pytest.mark.parametrize(
+    "name, hinge_side, fold_direction, hinge_count", _HINGE_CONFIGS
+)
+def test_hinge_configurations(shared_door, name, hinge_side, fold_direction,
+                              hinge_count):
+    """Test 6: Different hinge/fold configurations."""
+    vs = get_varset(shared_door)
+    vs.HingeSide = hinge_side
+    vs.FoldDirection = fold_direction
+    vs.HingeCount = hinge_count
+    shared_door.Document.recompute()
+
+    children = group_index(shared_door)
+    fold_hinges = children.get("FoldHinge", [])
+    assert len(fold_hinges) == hinge_count, (
+        f"Expected {hinge_count} fold hinges, got {len(fold_hinges)}"
+    )
+
+    wall_hinges = children.get("WallHinge", [])
+    assert len(wall_hinges) == 2, (
+        f"Expected 2 wall hinges, got {len(wall_hinges)}"
+    )
+
+    print(f"  {name}: side={hinge_side}, fold hinges={hinge_count} - PASSED")
 
 
-def test_handle_types():
+@pytest.mark.parametrize("handle_type", _HANDLE_TYPES)
+def test_handle_types(shared_door, handle_type):
     """Test 7: Different handle types."""
-    print("\n" + "=" * 70)
-    print("Test 7: Handle types")
-    print("=" * 70)
+    get_varset(shared_door).HandleType = handle_type
+    shared_door.Document.recompute()
 
-    for handle_type in ["None", "mushroom_knob_b2b", "pull_handle_round", "flush_handle_with_plate"]:
-        try:
-            safe_name = handle_type.replace("_", "")
-            door = createBiFoldDoor(f"Handle_{safe_name}")
-            vs = _get_varset(door)
-            vs.HandleType = handle_type
-            App.ActiveDocument.recompute()
-
-            handles = _get_children_by_prefix(door, "Handle")
-            if handle_type == "None":
-                assert len(handles) == 0, (
-                    f"Expected 0 handles for None, got {len(handles)}"
-                )
-            else:
-                assert len(handles) == 1, (
-                    f"Expected 1 handle for {handle_type}, got {len(handles)}"
-                )
-            print(f"  HandleType={handle_type} - PASSED")
-        except Exception as e:
-            print(f"  HandleType={handle_type}: FAILED - {e}")
+    handles = group_index(shared_door).get("Handle", [])
+    if handle_type == "None":
+        assert len(handles) == 0, (
+            f"Expected 0 handles for None, got {len(handles)}"
+        )
+    else:
+        assert len(handles) == 1, (
+            f"Expected 1 handle for {handle_type}, got {len(handles)}"
+        )
+    print(f"  HandleType={handle_type} - PASSED")
 
 
 def test_ghost_toggle():
@@ -265,25 +260,24 @@ def test_ghost_toggle():
     print("Test 8: Folded position ghost")
     print("=" * 70)
 
+    doc = makeDoc("BiFoldDoorTest")
     try:
         door = createBiFoldDoor("GhostTest")
-        vs = _get_varset(door)
+        vs = get_varset(door)
         vs.ShowFoldedPosition = True
-        App.ActiveDocument.recompute()
+        doc.recompute()
 
-        ghosts = _get_children_by_prefix(door, "Ghost")
+        ghosts = group_index(door).get("Ghost", [])
         assert len(ghosts) == 1, f"Expected 1 Ghost, got {len(ghosts)}"
         print("  ShowFoldedPosition=True: ghost created - PASSED")
 
         vs.ShowFoldedPosition = False
-        App.ActiveDocument.recompute()
-        ghosts = _get_children_by_prefix(door, "Ghost")
+        doc.recompute()
+        ghosts = group_index(door).get("Ghost", [])
         assert len(ghosts) == 0, f"Expected 0 Ghost when off, got {len(ghosts)}"
         print("  ShowFoldedPosition=False: ghost removed - PASSED")
-    except Exception as e:
-        print(f"  FAILED - {e}")
-        import traceback
-        traceback.print_exc()
+    finally:
+        closeDoc(doc)
 
 
 def test_show_hardware_toggle():
@@ -292,33 +286,34 @@ def test_show_hardware_toggle():
     print("Test 9: Hardware visibility toggle")
     print("=" * 70)
 
+    doc = makeDoc("BiFoldDoorTest")
     try:
         door = createBiFoldDoor("HardwareToggle")
-        vs = _get_varset(door)
+        vs = get_varset(door)
         vs.ShowHardware = True
-        App.ActiveDocument.recompute()
+        doc.recompute()
 
-        hw = [c for c in door.Group
-              if c.TypeId != "App::VarSet"
-              and not c.Label.startswith("WallPanel")
-              and not c.Label.startswith("FreePanel")]
+        hw = [c for c in door.Group if isHardwareChild(c)]
         assert len(hw) > 0, "Expected hardware children when ShowHardware=True"
+        names = sorted(c.Name for c in hw)
         print(f"  ShowHardware=True: {len(hw)} hardware children - OK")
 
         vs.ShowHardware = False
-        App.ActiveDocument.recompute()
-        hw = [c for c in door.Group
-              if c.TypeId != "App::VarSet"
-              and not c.Label.startswith("WallPanel")
-              and not c.Label.startswith("FreePanel")]
-        assert len(hw) == 0, f"Expected 0 hardware children, got {len(hw)}"
-        print("  ShowHardware=False: 0 hardware children - OK")
+        doc.recompute()
+        hw = [c for c in door.Group if isHardwareChild(c)]
+        assert sorted(c.Name for c in hw) == names, "Hardware should be kept"
+        shown = [c.Label for c in hw if c.Visibility]
+        assert not shown, f"Expected all hardware hidden, still shown: {shown}"
+        print("  ShowHardware=False: hardware kept but hidden - OK")
+
+        vs.ShowHardware = True
+        doc.recompute()
+        assert all(c.Visibility for c in hw), "Hardware should be shown again"
+        print("  ShowHardware=True again: hardware shown - OK")
 
         print("  Status: PASSED")
-    except Exception as e:
-        print(f"  Status: FAILED - {e}")
-        import traceback
-        traceback.print_exc()
+    finally:
+        closeDoc(doc)
 
 
 def test_calculated_properties():
@@ -327,22 +322,21 @@ def test_calculated_properties():
     print("Test 10: Calculated properties")
     print("=" * 70)
 
+    doc = makeDoc("BiFoldDoorTest")
     try:
         door = createBiFoldDoor("CalcTest")
-        vs = _get_varset(door)
+        vs = get_varset(door)
         vs.Width = 1200
         vs.Height = 2200
         vs.Thickness = 12
-        App.ActiveDocument.recompute()
+        doc.recompute()
 
         assert vs.Weight > 0, f"Expected positive weight, got {vs.Weight}"
         assert vs.Area > 0, f"Expected positive area, got {vs.Area}"
         print(f"  Weight: {vs.Weight:.2f} kg, Area: {vs.Area:.3f} m2")
         print("  Status: PASSED")
-    except Exception as e:
-        print(f"  Status: FAILED - {e}")
-        import traceback
-        traceback.print_exc()
+    finally:
+        closeDoc(doc)
 
 
 def run_all_tests():
@@ -350,26 +344,44 @@ def run_all_tests():
     print("BI-FOLD DOOR ASSEMBLY TEST SUITE")
     print("=" * 70)
 
-    doc = App.ActiveDocument
-    if doc is None:
-        doc = App.newDocument("BiFoldDoorTests")
-        print(f"\nCreated new document: {doc.Name}")
-    else:
-        print(f"\nUsing existing document: {doc.Name}")
-
-    test_basic_creation()
-    test_panel_width_calculation()
-    test_folded_width()
-    test_opening_width()
-    test_clearance_depth()
-    test_hinge_configurations()
-    test_handle_types()
-    test_ghost_toggle()
-    test_show_hardware_toggle()
-    test_calculated_properties()
+    # Each test opens and closes its own document
+    results = [
+        run_test(test)
+        for test in (
+            test_basic_creation,
+            test_panel_width_calculation,
+            test_folded_width,
+            test_opening_width,
+            test_clearance_depth,
+        )
+    ]
 
+    # Tests 6 and 7 share one door, as the shared_door fixture does
+    doc = makeDoc("BiFoldDoorTest")
+    try:
+        door = createBiFoldDoor("SharedBiFold")
+
+        print("\n" + "=" * 70)
+        print("Test 6: Hinge configurations")
+        print("=" * 70)
+        for config in _HINGE_CONFIGS:
+            results.append(run_test(test_hinge_configurations, door, *config))
+
+        print("\n" + "=" * 70)
+        print("Test 7: Handle types")
+        print("=" * 70)
+        for handle_type in _HANDLE_TYPES:
+            results.append(run_test(test_handle_types, door, handle_type))
+    finally:
+        closeDoc(doc)
+
+    for test in (test_ghost_toggle, test_show_hardware_toggle,
+                 test_calculated_properties):
+        results.append(run_test(test))
+
+    passed = sum(results)
     print("\n" + "=" * 70)
-    print("TEST SUITE COMPLETE")
+    print(f"TEST SUITE COMPLETE: {passed} passed, {len(results) - passed} failed")
     print("=" * 70)
 
 
@@ -24,11 +24,6 @@ Covers:
   - Door-width calculation with inline panels
 """
 
-import sys
-sys.path.insert(
-    0, r"C:\Users\tclou\AppData\Roaming\FreeCAD\v1-1\Mod\ShowerDesigner"
-)
-
 import FreeCAD as App
 from freecad.ShowerDesigner.Models.CornerEnclosure import createCornerEnclosure
 
@@ -10,11 +10,6 @@ Run:
     pytest freecad/ShowerDesigner/Tests/test_cut_list.py
 """
 
-import sys
-sys.path.insert(
-    0, r"C:\Users\tclou\AppData\Roaming\FreeCAD\v1-1\Mod\ShowerDesigner"
-)
-
 from freecad.ShowerDesigner.Data.CutList import (
     CutListItem,
     aggregateItems,
@@ -60,6 +55,13 @@ class TestCutListItem:
         assert item.product_code == "SDH-201-90"
         assert item.quantity == 2
 
+    def test_is_immutable(self):
+        import dataclasses
+
+        item = CutListItem("Glass", "Panel", "Clear 10mm")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            item.quantity = 5
+
 
 class TestAggregateItems:
     """Test aggregateItems merges identical items."""
@@ -266,343 +268,331 @@ import pytest
 class TestCutListExtractorIntegration:
     """Integration tests that create real FreeCAD objects."""
 
-    def _makeDoc(self):
-        doc = App.newDocument("CutListTest")
-        return doc
+    @classmethod
+    def setup_class(cls):
+        from freecad.ShowerDesigner.Models.CutListExtractor import CutListExtractor
+
+        # The extractor is stateless, so one instance serves every test
+        cls.extractor = CutListExtractor()
 
-    def _closeDoc(self, doc):
+    @pytest.fixture(scope="class")
+    def _classDoc(self):
+        doc = App.newDocument("CutListTest")
+        yield doc
         App.closeDocument(doc.Name)
 
-    def test_extract_glass_child(self):
+    @pytest.fixture
+    def doc(self, _classDoc):
+        """Shared document, emptied after each test instead of reopened."""
+        yield _classDoc
+        for name in [obj.Name for obj in _classDoc.Objects]:
+            if _classDoc.getObject(name) is not None:
+                _classDoc.removeObject(name)
+
+    def test_extract_glass_child(self, doc):
         from freecad.ShowerDesigner.Models.ChildProxies import GlassChild
-        from freecad.ShowerDesigner.Models.CutListExtractor import CutListExtractor
 
-        doc = self._makeDoc()
-        try:
-            part = doc.addObject("App::Part", "TestPanel")
-            glass = doc.addObject("Part::FeaturePython", "Glass")
-            GlassChild(glass)
-            glass.Width = 900
-            glass.Height = 2000
-            glass.Thickness = 10
-            glass.GlassType = "Clear"
-            part.addObject(glass)
-            doc.recompute()
-
-            extractor = CutListExtractor()
-            items = extractor.extract(part)
-
-            assert len(items) == 1
-            assert items[0].category == "Glass"
-            assert items[0].width == 900
-            assert items[0].height == 2000
-            assert "Clear" in items[0].description
-            assert "10" in items[0].description
-        finally:
-            self._closeDoc(doc)
-
-    def test_extract_hinge_child(self):
+        part = doc.addObject("App::Part", "TestPanel")
+        glass = doc.addObject("Part::FeaturePython", "Glass")
+        GlassChild(glass)
+        glass.Width = 900
+        glass.Height = 2000
+        glass.Thickness = 10
+        glass.GlassType = "Clear"
+        part.addObject(glass)
+        doc.recompute()
+
+        items = self.extractor.extract(part)
+
+        assert len(items) == 1
+        assert items[0].category == "Glass"
+        assert items[0].width == 900
+        assert items[0].height == 2000
+        assert "Clear" in items[0].description
+        assert "10" in items[0].description
+
+    def test_extract_hinge_child(self, doc):
         from freecad.ShowerDesigner.Models.ChildProxies import HingeChild
-        from freecad.ShowerDesigner.Models.CutListExtractor import CutListExtractor
 
-        doc = self._makeDoc()
-        try:
-            part = doc.addObject("App::Part", "TestDoor")
-            hinge = doc.addObject("Part::FeaturePython", "Hinge")
-            HingeChild(hinge)
-            hinge.HingeType = "bevel_90_wall_to_glass_full"
-            part.addObject(hinge)
-            doc.recompute()
-
-            extractor = CutListExtractor()
-            items = extractor.extract(part)
-
-            assert len(items) == 1
-            assert items[0].category == "Hinge"
-            assert "SDH-201-90" in items[0].product_code
-            assert "Bevel 90" in items[0].description
-        finally:
-            self._closeDoc(doc)
-
-    def test_extract_handle_child(self):
+        part = doc.addObject("App::Part", "TestDoor")
+        hinge = doc.addObject("Part::FeaturePython", "Hinge")
+        HingeChild(hinge)
+        hinge.HingeType = "bevel_90_wall_to_glass_full"
+        part.addObject(hinge)
+        doc.recompute()
+
+        items = self.extractor.extract(part)
+
+        assert len(items) == 1
+        assert items[0].category == "Hinge"
+        assert "SDH-201-90" in items[0].product_code
+        assert "Bevel 90" in items[0].description
+
+    def test_extract_handle_child(self, doc):
         from freecad.ShowerDesigner.Models.ChildProxies import HandleChild
-        from freecad.ShowerDesigner.Models.CutListExtractor import CutListExtractor
 
-        doc = self._makeDoc()
-        try:
-            part = doc.addObject("App::Part", "TestDoor")
-            handle = doc.addObject("Part::FeaturePython", "Handle")
-            HandleChild(handle)
-            handle.HandleType = "mushroom_knob_b2b"
-            part.addObject(handle)
-            doc.recompute()
-
-            extractor = CutListExtractor()
-            items = extractor.extract(part)
-
-            assert len(items) == 1
-            assert items[0].category == "Handle"
-            assert items[0].product_code == "DK-201"
-            assert "Mushroom" in items[0].description
-        finally:
-            self._closeDoc(doc)
-
-    def test_extract_clamp_child(self):
+        part = doc.addObject("App::Part", "TestDoor")
+        handle = doc.addObject("Part::FeaturePython", "Handle")
+        HandleChild(handle)
+        handle.HandleType = "mushroom_knob_b2b"
+        part.addObject(handle)
+        doc.recompute()
+
+        items = self.extractor.extract(part)
+
+        assert len(items) == 1
+        assert items[0].category == "Handle"
+        assert items[0].product_code == "DK-201"
+        assert "Mushroom" in items[0].description
+
+    def test_extract_clamp_child(self, doc):
         from freecad.ShowerDesigner.Models.ChildProxies import ClampChild
-        from freecad.ShowerDesigner.Models.CutListExtractor import CutListExtractor
 
-        doc = self._makeDoc()
-        try:
-            part = doc.addObject("App::Part", "TestPanel")
-            clamp = doc.addObject("Part::FeaturePython", "Clamp")
-            ClampChild(clamp)
-            clamp.ClampType = "L_Clamp"
-            part.addObject(clamp)
-            doc.recompute()
-
-            extractor = CutListExtractor()
-            items = extractor.extract(part)
-
-            assert len(items) == 1
-            assert items[0].category == "Clamp"
-            assert items[0].product_code == "GC-402"
-        finally:
-            self._closeDoc(doc)
-
-    def test_extract_channel_child(self):
+        part = doc.addObject("App::Part", "TestPanel")
+        clamp = doc.addObject("Part::FeaturePython", "Clamp")
+        ClampChild(clamp)
+        clamp.ClampType = "L_Clamp"
+        part.addObject(clamp)
+        doc.recompute()
+
+        items = self.extractor.extract(part)
+
+        assert len(items) == 1
+        assert items[0].category == "Clamp"
+        assert items[0].product_code == "GC-402"
+
+    def test_extract_channel_child(self, doc):
         from freecad.ShowerDesigner.Models.ChildProxies import ChannelChild
-        from freecad.ShowerDesigner.Models.CutListExtractor import CutListExtractor
 
-        doc = self._makeDoc()
-        try:
-            part = doc.addObject("App::Part", "TestPanel")
-            ch = doc.addObject("Part::FeaturePython", "Channel")
-            ChannelChild(ch)
-            ch.ChannelLocation = "wall"
-            ch.ChannelLength = 1800
-            part.addObject(ch)
-            doc.recompute()
-
-            extractor = CutListExtractor()
-            items = extractor.extract(part)
-
-            assert len(items) == 1
-            assert items[0].category == "Channel"
-            assert items[0].width == 1800
-        finally:
-            self._closeDoc(doc)
-
-    def test_skip_visualization_children(self):
+        part = doc.addObject("App::Part", "TestPanel")
+        ch = doc.addObject("Part::FeaturePython", "Channel")
+        ChannelChild(ch)
+        ch.ChannelLocation = "wall"
+        ch.ChannelLength = 1800
+        part.addObject(ch)
+        doc.recompute()
+
+        items = self.extractor.extract(part)
+
+        assert len(items) == 1
+        assert items[0].category == "Channel"
+        assert items[0].width == 1800
+
+    def test_skip_visualization_children(self, doc):
         from freecad.ShowerDesigner.Models.ChildProxies import SwingArcChild
-        from freecad.ShowerDesigner.Models.CutListExtractor import CutListExtractor
 
-        doc = self._makeDoc()
-        try:
-            part = doc.addObject("App::Part", "TestDoor")
-            arc = doc.addObject("Part::FeaturePython", "SwingArc")
-            SwingArcChild(arc)
-            part.addObject(arc)
-            doc.recompute()
+        part = doc.addObject("App::Part", "TestDoor")
+        arc = doc.addObject("Part::FeaturePython", "SwingArc")
+        SwingArcChild(arc)
+        part.addObject(arc)
+        doc.recompute()
 
-            extractor = CutListExtractor()
-            items = extractor.extract(part)
+        items = self.extractor.extract(part)
 
-            assert len(items) == 0
-        finally:
-            self._closeDoc(doc)
+        assert len(items) == 0
 
-    def test_skip_varset_and_controller(self):
-        from freecad.ShowerDesigner.Models.CutListExtractor import CutListExtractor
+    def test_skip_hardware_when_show_hardware_off(self, doc):
+        from freecad.ShowerDesigner.Models.ChildProxies import (
+            ClampChild, GlassChild,
+        )
+
+        part = doc.addObject("App::Part", "TestPanel")
+        vs = doc.addObject("App::VarSet", "VarSet")
+        vs.addProperty(
+            "App::PropertyBool", "ShowHardware", "Hardware Display",
+            "Show hardware"
+        )
+        vs.ShowHardware = False
+        glass = doc.addObject("Part::FeaturePython", "Glass")
+        GlassChild(glass)
+        clamp = doc.addObject("Part::FeaturePython", "Clamp")
+        ClampChild(clamp)
+        clamp.ClampType = "L_Clamp"
+        part.addObject(vs)
+        part.addObject(glass)
+        part.addObject(clamp)
+        doc.recompute()
+
+        items = self.extractor.extract(part)
+
+        assert len(items) == 1
+        assert items[0].category == "Glass"
+
+    def test_keep_hardware_hidden_in_tree(self, doc):
+        """Hiding a child in the tree does not drop it from the BOM."""
+        from freecad.ShowerDesigner.Models.ChildProxies import ClampChild
+
+        part = doc.addObject("App::Part", "TestPanel")
+        clamp = doc.addObject("Part::FeaturePython", "Clamp")
+        ClampChild(clamp)
+        clamp.ClampType = "L_Clamp"
+        clamp.Visibility = False
+        part.addObject(clamp)
+        doc.recompute()
+
+        items = self.extractor.extract(part)
 
-        doc = self._makeDoc()
-        try:
-            part = doc.addObject("App::Part", "TestAssembly")
-            vs = doc.addObject("App::VarSet", "VarSet")
-            part.addObject(vs)
-            doc.recompute()
+        assert len(items) == 1
+        assert items[0].category == "Clamp"
 
-            extractor = CutListExtractor()
-            items = extractor.extract(part)
+    def test_skip_varset_and_controller(self, doc):
+        part = doc.addObject("App::Part", "TestAssembly")
+        vs = doc.addObject("App::VarSet", "VarSet")
+        part.addObject(vs)
+        doc.recompute()
 
-            assert len(items) == 0
-        finally:
-            self._closeDoc(doc)
+        items = self.extractor.extract(part)
 
-    def test_nested_parts_recurse(self):
+        assert len(items) == 0
+
+    def test_nested_parts_recurse(self, doc):
         from freecad.ShowerDesigner.Models.ChildProxies import GlassChild
-        from freecad.ShowerDesigner.Models.CutListExtractor import CutListExtractor
 
-        doc = self._makeDoc()
-        try:
-            enclosure = doc.addObject("App::Part", "CornerEnclosure")
-            sub_panel = doc.addObject("App::Part", "FixedPanel")
-            glass = doc.addObject("Part::FeaturePython", "Glass")
-            GlassChild(glass)
-            glass.Width = 600
-            glass.Height = 2000
-            glass.Thickness = 8
-            sub_panel.addObject(glass)
-            enclosure.addObject(sub_panel)
-            doc.recompute()
-
-            extractor = CutListExtractor()
-            items = extractor.extract(enclosure)
-
-            assert len(items) == 1
-            assert items[0].component == "FixedPanel"
-            assert items[0].width == 600
-        finally:
-            self._closeDoc(doc)
-
-    def test_extract_seals_from_varset(self):
+        enclosure = doc.addObject("App::Part", "CornerEnclosure")
+        sub_panel = doc.addObject("App::Part", "FixedPanel")
+        glass = doc.addObject("Part::FeaturePython", "Glass")
+        GlassChild(glass)
+        glass.Width = 600
+        glass.Height = 2000
+        glass.Thickness = 8
+        sub_panel.addObject(glass)
+        enclosure.addObject(sub_panel)
+        doc.recompute()
+
+        items = self.extractor.extract(enclosure)
+
+        assert len(items) == 1
+        assert items[0].component == "FixedPanel"
+        assert items[0].width == 600
+
+    def test_extract_seals_from_varset(self, doc):
         """VarSet with seal properties → Seal BOM items."""
-        from freecad.ShowerDesigner.Models.CutListExtractor import CutListExtractor
+        part = doc.addObject("App::Part", "FixedPanel")
+        vs = doc.addObject("App::VarSet", "VarSet")
+        vs.addProperty(
+            "App::PropertyLength", "Width", "Dimensions", "Panel width"
+        )
+        vs.Width = 900
+        vs.addProperty(
+            "App::PropertyLength", "Height", "Dimensions", "Panel height"
+        )
+        vs.Height = 2000
+        vs.addProperty(
+            "App::PropertyLength", "Thickness", "Dimensions", "Glass thickness"
+        )
+        vs.Thickness = 8
+        vs.addProperty(
+            "App::PropertyEnumeration", "WallSeal", "Seal", "Wall seal"
+        )
+        vs.WallSeal = ["No Seal", "Bubble Seal", "Centre Lip Seal"]
+        vs.WallSeal = "Bubble Seal"
+        vs.addProperty(
+            "App::PropertyEnumeration", "FloorSeal", "Seal", "Floor seal"
+        )
+        vs.FloorSeal = ["No Seal", "Bubble Seal"]
+        vs.FloorSeal = "No Seal"
+        part.addObject(vs)
+        doc.recompute()
 
-        doc = self._makeDoc()
-        try:
-            part = doc.addObject("App::Part", "FixedPanel")
-            vs = doc.addObject("App::VarSet", "VarSet")
-            vs.addProperty(
-                "App::PropertyLength", "Width", "Dimensions", "Panel width"
-            )
-            vs.Width = 900
-            vs.addProperty(
-                "App::PropertyLength", "Height", "Dimensions", "Panel height"
-            )
-            vs.Height = 2000
-            vs.addProperty(
-                "App::PropertyLength", "Thickness", "Dimensions", "Glass thickness"
-            )
-            vs.Thickness = 8
-            vs.addProperty(
-                "App::PropertyEnumeration", "WallSeal", "Seal", "Wall seal"
-            )
-            vs.WallSeal = ["No Seal", "Bubble Seal", "Centre Lip Seal"]
-            vs.WallSeal = "Bubble Seal"
-            vs.addProperty(
-                "App::PropertyEnumeration", "FloorSeal", "Seal", "Floor seal"
-            )
-            vs.FloorSeal = ["No Seal", "Bubble Seal"]
-            vs.FloorSeal = "No Seal"
-            part.addObject(vs)
-            doc.recompute()
-
-            extractor = CutListExtractor()
-            items = extractor.extract(part)
-
-            seal_items = [i for i in items if i.category == "Seal"]
-            assert len(seal_items) == 1  # Only WallSeal (FloorSeal is "No Seal")
-            assert seal_items[0].description == "Bubble Seal"
-            assert seal_items[0].width == 2000  # Wall seal → height
-            assert seal_items[0].product_code == "TSS-004-8"
-            assert "Wall" in seal_items[0].notes
-        finally:
-            self._closeDoc(doc)
-
-    def test_extract_seals_door_varset(self):
-        """VarSet with door seal properties → multiple Seal BOM items."""
-        from freecad.ShowerDesigner.Models.CutListExtractor import CutListExtractor
+        items = self.extractor.extract(part)
 
-        doc = self._makeDoc()
-        try:
-            part = doc.addObject("App::Part", "HingedDoor")
-            vs = doc.addObject("App::VarSet", "VarSet")
-            vs.addProperty("App::PropertyLength", "Width", "Dimensions", "")
-            vs.Width = 800
-            vs.addProperty("App::PropertyLength", "Height", "Dimensions", "")
-            vs.Height = 2000
-            vs.addProperty("App::PropertyLength", "Thickness", "Dimensions", "")
-            vs.Thickness = 10
-            vs.addProperty(
-                "App::PropertyEnumeration", "HingeSideSeal", "Seal", ""
-            )
-            vs.HingeSideSeal = ["No Seal", "180 Soft Lip Seal"]
-            vs.HingeSideSeal = "180 Soft Lip Seal"
-            vs.addProperty(
-                "App::PropertyEnumeration", "FloorSeal", "Seal", ""
-            )
-            vs.FloorSeal = ["No Seal", "Drip & Wipe Seal"]
-            vs.FloorSeal = "Drip & Wipe Seal"
-            vs.addProperty(
-                "App::PropertyEnumeration", "ClosingSeal", "Seal", ""
-            )
-            vs.ClosingSeal = ["No Seal", "90/180 Magnet Seal"]
-            vs.ClosingSeal = "90/180 Magnet Seal"
-            part.addObject(vs)
-            doc.recompute()
-
-            extractor = CutListExtractor()
-            items = extractor.extract(part)
-
-            seal_items = [i for i in items if i.category == "Seal"]
-            assert len(seal_items) == 3
-            descriptions = {s.description for s in seal_items}
-            assert "180 Soft Lip Seal" in descriptions
-            assert "Drip & Wipe Seal" in descriptions
-            assert "90/180 Magnet Seal" in descriptions
-
-            # Check dimensions: floor seal → width, others → height
-            floor = [s for s in seal_items if "Floor" in s.notes][0]
-            assert floor.width == 800
-            hinge = [s for s in seal_items if "Hinge Side" in s.notes][0]
-            assert hinge.width == 2000
-        finally:
-            self._closeDoc(doc)
-
-    def test_full_assembly_multiple_children(self):
+        seal_items = [i for i in items if i.category == "Seal"]
+        assert len(seal_items) == 1  # Only WallSeal (FloorSeal is "No Seal")
+        assert seal_items[0].description == "Bubble Seal"
+        assert seal_items[0].width == 2000  # Wall seal → height
+        assert seal_items[0].product_code == "TSS-004-8"
+        assert "Wall" in seal_items[0].notes
+
+    def test_extract_seals_door_varset(self, doc):
+        """VarSet with door seal properties → multiple Seal BOM items."""
+        part = doc.addObject("App::Part", "HingedDoor")
+        vs = doc.addObject("App::VarSet", "VarSet")
+        vs.addProperty("App::PropertyLength", "Width", "Dimensions", "")
+        vs.Width = 800
+        vs.addProperty("App::PropertyLength", "Height", "Dimensions", "")
+        vs.Height = 2000
+        vs.addProperty("App::PropertyLength", "Thickness", "Dimensions", "")
+        vs.Thickness = 10
+        vs.addProperty(
+            "App::PropertyEnumeration", "HingeSideSeal", "Seal", ""
+        )
+        vs.HingeSideSeal = ["No Seal", "180 Soft Lip Seal"]
+        vs.HingeSideSeal = "180 Soft Lip Seal"
+        vs.addProperty(
+            "App::PropertyEnumeration", "FloorSeal", "Seal", ""
+        )
+        vs.FloorSeal = ["No Seal", "Drip & Wipe Seal"]
+        vs.FloorSeal = "Drip & Wipe Seal"
+        vs.addProperty(
+            "App::PropertyEnumeration", "ClosingSeal", "Seal", ""
+        )
+        vs.ClosingSeal = ["No Seal", "90/180 Magnet Seal"]
+        vs.ClosingSeal = "90/180 Magnet Seal"
+        part.addObject(vs)
+        doc.recompute()
+
+        items = self.extractor.extract(part)
+
+        seal_items = [i for i in items if i.category == "Seal"]
+        assert len(seal_items) == 3
+        descriptions = {s.description for s in seal_items}
+        assert "180 Soft Lip Seal" in descriptions
+        assert "Drip & Wipe Seal" in descriptions
+        assert "90/180 Magnet Seal" in descriptions
+
+        # Check dimensions: floor seal → width, others → height
+        floor = [s for s in seal_items if "Floor" in s.notes][0]
+        assert floor.width == 800
+        hinge = [s for s in seal_items if "Hinge Side" in s.notes][0]
+        assert hinge.width == 2000
+
+    def test_full_assembly_multiple_children(self, doc):
         """Assembly with glass + hinge + handle → 3 BOM items."""
         from freecad.ShowerDesigner.Models.ChildProxies import (
             GlassChild,
             HandleChild,
             HingeChild,
         )
-        from freecad.ShowerDesigner.Models.CutListExtractor import CutListExtractor
+        part = doc.addObject("App::Part", "HingedDoor")
+
+        glass = doc.addObject("Part::FeaturePython", "Glass")
+        GlassChild(glass)
+        glass.Width = 800
+        glass.Height = 2000
+        glass.Thickness = 10
+        part.addObject(glass)
+
+        h1 = doc.addObject("Part::FeaturePython", "Hinge1")
+        HingeChild(h1)
+        h1.HingeType = "bevel_90_wall_to_glass_full"
+        part.addObject(h1)
+
+        h2 = doc.addObject("Part::FeaturePython", "Hinge2")
+        HingeChild(h2)
+        h2.HingeType = "bevel_90_wall_to_glass_full"
+        part.addObject(h2)
+
+        handle = doc.addObject("Part::FeaturePython", "Handle")
+        HandleChild(handle)
+        handle.HandleType = "mushroom_knob_b2b"
+        part.addObject(handle)
+
+        doc.recompute()
+
+        items = self.extractor.extract(part)
+
+        assert len(items) == 4  # 1 glass + 2 hinges + 1 handle
+        categories = [i.category for i in items]
+        assert categories.count("Glass") == 1
+        assert categories.count("Hinge") == 2
+        assert categories.count("Handle") == 1
 
-        doc = self._makeDoc()
-        try:
-            part = doc.addObject("App::Part", "HingedDoor")
-
-            glass = doc.addObject("Part::FeaturePython", "Glass")
-            GlassChild(glass)
-            glass.Width = 800
-            glass.Height = 2000
-            glass.Thickness = 10
-            part.addObject(glass)
-
-            h1 = doc.addObject("Part::FeaturePython", "Hinge1")
-            HingeChild(h1)
-            h1.HingeType = "bevel_90_wall_to_glass_full"
-            part.addObject(h1)
-
-            h2 = doc.addObject("Part::FeaturePython", "Hinge2")
-            HingeChild(h2)
-            h2.HingeType = "bevel_90_wall_to_glass_full"
-            part.addObject(h2)
-
-            handle = doc.addObject("Part::FeaturePython", "Handle")
-            HandleChild(handle)
-            handle.HandleType = "mushroom_knob_b2b"
-            part.addObject(handle)
-
-            doc.recompute()
-
-            extractor = CutListExtractor()
-            items = extractor.extract(part)
-
-            assert len(items) == 4  # 1 glass + 2 hinges + 1 handle
-            categories = [i.category for i in items]
-            assert categories.count("Glass") == 1
-            assert categories.count("Hinge") == 2
-            assert categories.count("Handle") == 1
-
-            # After aggregation, hinges should merge
-            from freecad.ShowerDesigner.Data.CutList import aggregateItems
-            agg = aggregateItems(items)
-            hinge_items = [i for i in agg if i.category == "Hinge"]
-            assert len(hinge_items) == 1
-            assert hinge_items[0].quantity == 2
-        finally:
-            self._closeDoc(doc)
+        # After aggregation, hinges should merge
+        from freecad.ShowerDesigner.Data.CutList import aggregateItems
+        agg = aggregateItems(items)
+        hinge_items = [i for i in agg if i.category == "Hinge"]
+        assert len(hinge_items) == 1
+        assert hinge_items[0].quantity == 2
 
 
 # ======================================================================
@@ -610,48 +600,8 @@ class TestCutListExtractorIntegration:
 # ======================================================================
 
 def run_all_tests():
-    """Run all tests from the FreeCAD console."""
-    import traceback
-
-    test_classes = [
-        TestCutListItem,
-        TestAggregateItems,
-        TestSealProductCodeLookup,
-        TestToCSV,
-        TestToTable,
-        TestToConsoleTable,
-    ]
-
-    if HAS_FREECAD:
-        test_classes.append(TestCutListExtractorIntegration)
-
-    passed = 0
-    failed = 0
-    errors = []
-
-    for cls in test_classes:
-        instance = cls()
-        for name in dir(instance):
-            if not name.startswith("test_"):
-                continue
-            method = getattr(instance, name)
-            try:
-                method()
-                passed += 1
-                print(f"  PASS: {cls.__name__}.{name}")
-            except Exception as e:
-                failed += 1
-                errors.append(f"  FAIL: {cls.__name__}.{name}: {e}")
-                traceback.print_exc()
-
-    print(f"\n{'='*50}")
-    print(f"Results: {passed} passed, {failed} failed")
-    if errors:
-        print("\nFailures:")
-        for e in errors:
-            print(e)
-
-    return failed == 0
+    """Run all tests through pytest (for FreeCAD console)."""
+    return pytest.main([__file__, "-q"])
 
 
 if __name__ == "__main__":
@@ -7,9 +7,7 @@ Test script for GlassPanel implementation
 Run this in FreeCAD's Python console to test the GlassPanel class.
 """
 
-import sys
-sys.path.insert(0, '/home/claude')
-
+import FreeCAD as App
 from freecad.ShowerDesigner.Models.GlassPanel import createGlassPanel
 from freecad.ShowerDesigner.Data.GlassSpecs import (
     validateGlassThickness,
@@ -99,6 +97,7 @@ panel_configs = [
     ("FrostedPanel", 600, 1800, 6, "Frosted"),
     ("BronzePanel", 1000, 2000, 10, "Bronze"),
 ]
+created = []
 for name, width, height, thickness, glass_type in panel_configs:
     try:
         panel = createGlassPanel(name)
@@ -106,10 +105,13 @@ for name, width, height, thickness, glass_type in panel_configs:
         panel.Height = height
         panel.Thickness = thickness
         panel.GlassType = glass_type
-        panel.Document.recompute()
-        print(f"   ✓ {name}: {width}x{height}mm, {thickness}mm {glass_type}")
+        created.append((name, width, height, thickness, glass_type))
     except Exception as e:
         print(f"   ✗ Error creating {name}: {e}")
+# Configure every panel first, then rebuild their shapes in one recompute
+App.ActiveDocument.recompute()
+for name, width, height, thickness, glass_type in created:
+    print(f"   ✓ {name}: {width}x{height}mm, {thickness}mm {glass_type}")
 
 print("\n" + "="*60)
 print("Testing Complete!")
@@ -11,11 +11,6 @@ Or via pytest (if FreeCAD modules are accessible):
     pytest freecad/ShowerDesigner/Tests/test_glass_shelf.py
 """
 
-import sys
-sys.path.insert(
-    0, r"C:\Users\tclou\AppData\Roaming\FreeCAD\v1-1\Mod\ShowerDesigner"
-)
-
 import FreeCAD as App
 from freecad.ShowerDesigner.Models.GlassShelf import (
     createGlassShelfShape,
@@ -11,8 +11,7 @@ Run this in FreeCAD's Python console:
     exec(open('test_glass_visual.py').read())
 """
 
-import sys
-sys.path.insert(0, '/home/claude')
+import os
 
 import FreeCAD as App
 from freecad.ShowerDesigner.Models.GlassPanel import createGlassPanel
@@ -44,55 +43,88 @@ print("Creating glass panel showcase...")
 print("="*70)
 
 panels = []
-x_offset = 0
 spacing = 1200  # mm spacing between panels
 
+# Build the row one property at a time across all panels rather than one
+# panel at a time, so each kind of change is applied in a single pass
+
+# Pass 1: create panels, hidden until the whole row is built so the 3D
+# view is not redrawn for every property change
 for i, (glass_type, description) in enumerate(glass_types):
     print(f"\n{i+1}. Creating {glass_type} panel...")
 
     try:
-        # Create panel
         panel = createGlassPanel(f"{glass_type}Panel")
+        if App.GuiUp:
+            panel.ViewObject.Visibility = False
+        panels.append((panel, glass_type, description))
 
-        # Set standard dimensions
-        panel.Width = 900
-        panel.Height = 2000
-        panel.Thickness = 10
+    except Exception as e:
+        print(f"   ✗ Error creating {glass_type} panel: {e}")
+        import traceback
+        traceback.print_exc()
 
-        # Set glass type
-        panel.GlassType = glass_type
 
-        # Position panels in a row
-        panel.Position = App.Vector(x_offset, 0, 0)
-        x_offset += spacing
+def _applyPass(panels, what, apply):
+    """Run apply(i, panel, glass_type) on each panel, reporting and dropping
+    any panel it fails on so one bad value does not stop the showcase."""
+    kept = []
+    for i, (panel, glass_type, description) in enumerate(panels):
+        try:
+            apply(i, panel, glass_type)
+            kept.append((panel, glass_type, description))
+        except Exception as e:
+            print(f"   ✗ Error setting {what} on {glass_type} panel: {e}")
+    return kept
 
-        # Recompute to apply changes
-        doc.recompute()
 
-        panels.append(panel)
+def _setDimensions(i, panel, glass_type):
+    panel.Width = 900
+    panel.Height = 2000
+    panel.Thickness = 10
 
-        # Display properties
-        print(f"   ✓ Panel created: {panel.Label}")
-        print(f"   - Glass Type: {glass_type}")
-        print(f"   - Description: {description}")
 
-        if App.GuiUp and hasattr(panel, "ViewObject"):
-            vobj = panel.ViewObject
-            print(f"   - Shape Color: {vobj.ShapeColor}")
-            print(f"   - Transparency: {vobj.Transparency}%")
-            print(f"   - Display Mode: {vobj.DisplayMode}")
+def _setGlassType(i, panel, glass_type):
+    panel.GlassType = glass_type
+
+
+def _setPosition(i, panel, glass_type):
+    # Position panels in a row
+    panel.Position = App.Vector(i * spacing, 0, 0)
 
-    except Exception as e:
-        print(f"   ✗ Error creating {glass_type} panel: {e}")
-        import traceback
-        traceback.print_exc()
+
+# Pass 2: standard dimensions
+panels = _applyPass(panels, "dimensions", _setDimensions)
+
+# Pass 3: glass type
+panels = _applyPass(panels, "glass type", _setGlassType)
+
+# Pass 4: position panels in a row
+panels = _applyPass(panels, "position", _setPosition)
+
+# Build the whole showcase in one recompute, then report on each panel
+doc.recompute()
+if App.GuiUp:
+    for panel, _glass_type, _description in panels:
+        panel.ViewObject.Visibility = True
+
+for panel, _glass_type, description in panels:
+    print(f"\n   ✓ Panel created: {panel.Label}")
+    print(f"   - Glass Type: {panel.GlassType}")
+    print(f"   - Description: {description}")
+
+    if App.GuiUp and hasattr(panel, "ViewObject"):
+        vobj = panel.ViewObject
+        print(f"   - Shape Color: {vobj.ShapeColor}")
+        print(f"   - Transparency: {vobj.Transparency}%")
+        print(f"   - Display Mode: {vobj.DisplayMode}")
 
 print("\n" + "="*70)
 print("Testing property changes...")
 print("="*70)
 
 if panels:
-    test_panel = panels[0]
+    test_panel = panels[0][0]
     print(f"\nTesting dynamic glass type changes on: {test_panel.Label}")
 
     original_type = test_panel.GlassType
@@ -103,8 +135,9 @@ if panels:
     for new_type in test_sequence:
         try:
             print(f"\n   Changing to {new_type}...")
+            # Glass type only affects appearance and weight, which update
+            # on the property change, so no recompute per step
             test_panel.GlassType = new_type
-            doc.recompute()
 
             if App.GuiUp:
                 vobj = test_panel.ViewObject
@@ -131,21 +164,30 @@ y_offset = 2500  # mm offset from first row
 
 print("\nCreating thickness comparison (all Clear glass):")
 
+thickness_panels = []
 for i, thickness in enumerate(thicknesses):
     try:
         panel = createGlassPanel(f"Clear_{thickness}mm")
+        if App.GuiUp:
+            panel.ViewObject.Visibility = False
         panel.Width = 600
         panel.Height = 1800
         panel.Thickness = thickness
         panel.GlassType = "Clear"
         panel.Position = App.Vector(i * 800, y_offset, 0)
-        doc.recompute()
-
-        print(f"   ✓ {thickness}mm panel: Weight = {panel.Weight:.2f} kg")
+        thickness_panels.append((thickness, panel))
 
     except Exception as e:
         print(f"   ✗ Error creating {thickness}mm panel: {e}")
 
+doc.recompute()
+if App.GuiUp:
+    for _thickness, panel in thickness_panels:
+        panel.ViewObject.Visibility = True
+
+for thickness, panel in thickness_panels:
+    print(f"   ✓ {thickness}mm panel: Weight = {panel.Weight:.2f} kg")
+
 print("\n" + "="*70)
 print("Summary")
 print("="*70)
@@ -182,8 +224,9 @@ print("\n" + "="*70)
 print("Visual Test Complete!")
 print("="*70)
 
-# Fit all objects in view if GUI is up
-if App.GuiUp:
+# Fit all objects in view if GUI is up; opt in with SHOWER_TEST_VIEWFIT=1
+# since fitting a large document can take longer than the tests themselves
+if App.GuiUp and os.environ.get("SHOWER_TEST_VIEWFIT") == "1":
     try:
         import FreeCADGui as Gui
         Gui.SendMsgToActiveView("ViewFit")
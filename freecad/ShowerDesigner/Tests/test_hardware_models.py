@@ -4,29 +4,32 @@
 """
 Test script for standalone hardware model classes.
 
-Requires FreeCAD accessible. Run in FreeCAD console:
+Requires FreeCAD accessible, and pytest, including when run from FreeCAD's
+Python console (install it into FreeCAD's Python first):
     exec(open('path/to/test_hardware_models.py').read())
 
 Or via pytest (if FreeCAD modules are accessible):
     pytest freecad/ShowerDesigner/Tests/test_hardware_models.py
+
+Every test builds its own shape or document, so the cases can also be
+spread over worker processes with pytest-xdist:
+    pytest -n auto freecad/ShowerDesigner/Tests/test_hardware_models.py
 """
 
-import sys
-sys.path.insert(
-    0, r"C:\Users\tclou\AppData\Roaming\FreeCAD\v1-1\Mod\ShowerDesigner"
-)
+import pytest
+
+App = pytest.importorskip("FreeCAD")
 
-import FreeCAD as App
-from freecad.ShowerDesigner.Models.Hinge import createHinge, createHingeShape
-from freecad.ShowerDesigner.Models.Handle import createHandle, createHandleShape
-from freecad.ShowerDesigner.Models.Clamp import createClamp, createClampShape
-from freecad.ShowerDesigner.Models.SupportBar import createSupportBar, createSupportBarShape
-from freecad.ShowerDesigner.Data.HardwareSpecs import (
+from freecad.ShowerDesigner.Data.HardwareSpecs import (  # noqa: E402
     HINGE_SPECS,
     HANDLE_SPECS,
     CLAMP_SPECS,
     SUPPORT_BAR_SPECS,
 )
+from freecad.ShowerDesigner.Tests.assembly_helpers import (  # noqa: E402
+    closeDoc,
+    makeDoc,
+)
 
 
 # -----------------------------------------------------------------------
@@ -35,20 +38,25 @@ from freecad.ShowerDesigner.Data.HardwareSpecs import (
 
 def test_createHingeShape():
     """Test standalone hinge shape creation."""
+    from freecad.ShowerDesigner.Models.Hinge import createHingeShape
+
     print("\n" + "=" * 70)
     print("Test: createHingeShape")
     print("=" * 70)
 
     shape = createHingeShape(65, 20, 90)
     assert shape is not None, "Shape should not be None"
-    assert shape.BoundBox.XLength == 65
-    assert shape.BoundBox.YLength == 20
-    assert shape.BoundBox.ZLength == 90
+    shape_bb = shape.BoundBox
+    assert shape_bb.XLength == 65
+    assert shape_bb.YLength == 20
+    assert shape_bb.ZLength == 90
     print("  createHingeShape(65, 20, 90) - PASSED")
 
 
 def test_createHandleShape_knob():
     """Test mushroom knob handle shape (catalogue key: mushroom_knob_b2b)."""
+    from freecad.ShowerDesigner.Models.Handle import createHandleShape
+
     print("\n" + "=" * 70)
     print("Test: createHandleShape - mushroom_knob_b2b")
     print("=" * 70)
@@ -60,6 +68,8 @@ def test_createHandleShape_knob():
 
 def test_createHandleShape_bar():
     """Test pull handle (round) shape (catalogue key: pull_handle_round)."""
+    from freecad.ShowerDesigner.Models.Handle import createHandleShape
+
     print("\n" + "=" * 70)
     print("Test: createHandleShape - pull_handle_round")
     print("=" * 70)
@@ -71,6 +81,8 @@ def test_createHandleShape_bar():
 
 def test_createHandleShape_pull():
     """Test flush handle with plate shape (catalogue key: flush_handle_with_plate)."""
+    from freecad.ShowerDesigner.Models.Handle import createHandleShape
+
     print("\n" + "=" * 70)
     print("Test: createHandleShape - flush_handle_with_plate")
     print("=" * 70)
@@ -82,6 +94,8 @@ def test_createHandleShape_pull():
 
 def test_createHandleShape_none():
     """Test that 'None' handle type returns None."""
+    from freecad.ShowerDesigner.Models.Handle import createHandleShape
+
     print("\n" + "=" * 70)
     print("Test: createHandleShape - None")
     print("=" * 70)
@@ -91,28 +105,34 @@ def test_createHandleShape_none():
     print("  createHandleShape('None') returns None - PASSED")
 
 
-def test_createClampShape():
-    """Test standalone clamp shape creation for all types."""
+@pytest.mark.parametrize("clamp_type", list(CLAMP_SPECS))
+def test_createClampShape(clamp_type):
+    """Test standalone clamp shape creation for each type."""
+    from freecad.ShowerDesigner.Models.Clamp import createClampShape
+
     print("\n" + "=" * 70)
-    print("Test: createClampShape")
+    print(f"Test: createClampShape - {clamp_type}")
     print("=" * 70)
 
-    for clamp_type in CLAMP_SPECS:
-        shape = createClampShape(clamp_type)
-        bb = CLAMP_SPECS[clamp_type]["bounding_box"]
-        assert shape is not None
-        # Tolerance for boolean/chamfer floating-point deviation
-        assert abs(shape.BoundBox.XLength - bb["width"]) < 0.5, \
-            f"{clamp_type} width: expected {bb['width']}, got {shape.BoundBox.XLength}"
-        assert abs(shape.BoundBox.YLength - bb["depth"]) < 0.5, \
-            f"{clamp_type} depth: expected {bb['depth']}, got {shape.BoundBox.YLength}"
-        assert abs(shape.BoundBox.ZLength - bb["height"]) < 0.5, \
-            f"{clamp_type} height: expected {bb['height']}, got {shape.BoundBox.ZLength}"
-        print(f"  createClampShape('{clamp_type}') - PASSED")
-
-
+    shape = createClampShape(clamp_type)
+    bb = CLAMP_SPECS[clamp_type]["bounding_box"]
+    assert shape is not None
+    # Tolerance for boolean/chamfer floating-point deviation
+    shape_bb = shape.BoundBox
+    assert abs(shape_bb.XLength - bb["width"]) < 0.5, \
+        f"{clamp_type} width: expected {bb['width']}, got {shape_bb.XLength}"
+    assert abs(shape_bb.YLength - bb["depth"]) < 0.5, \
+        f"{clamp_type} depth: expected {bb['depth']}, got {shape_bb.YLength}"
+    assert abs(shape_bb.ZLength - bb["height"]) < 0.5, \
+        f"{clamp_type} height: expected {bb['height']}, got {shape_bb.ZLength}"
+    print(f"  createClampShape('{clamp_type}') - PASSED")
+
+
+@pytest.mark.slow
 def test_uclamp_topology():
     """U-Clamp should have more faces than a simple box (U-slot creates internal faces)."""
+    from freecad.ShowerDesigner.Models.Clamp import createClampShape
+
     print("\n" + "=" * 70)
     print("Test: U_Clamp topology")
     print("=" * 70)
@@ -122,8 +142,11 @@ def test_uclamp_topology():
     print(f"  U_Clamp faces: {len(shape.Faces)} - PASSED")
 
 
+@pytest.mark.slow
 def test_lclamp_topology():
     """L-Clamp compound should have two solids (L-body + pressure plate)."""
+    from freecad.ShowerDesigner.Models.Clamp import createClampShape
+
     print("\n" + "=" * 70)
     print("Test: L_Clamp topology")
     print("=" * 70)
@@ -134,26 +157,39 @@ def test_lclamp_topology():
     print(f"  L_Clamp solids: {len(shape.Solids)} - PASSED")
 
 
-def test_createSupportBarShape():
-    """Test standalone support bar shape creation."""
+@pytest.mark.parametrize("bar_type", list(SUPPORT_BAR_SPECS))
+def test_createSupportBarShape(bar_type):
+    """Test standalone support bar shape creation for each type."""
+    from freecad.ShowerDesigner.Models.SupportBar import createSupportBarShape
+
     print("\n" + "=" * 70)
-    print("Test: createSupportBarShape")
+    print(f"Test: createSupportBarShape - {bar_type}")
     print("=" * 70)
 
-    for bar_type in SUPPORT_BAR_SPECS:
-        shape = createSupportBarShape(bar_type, 500, 16)
-        assert shape is not None
-        print(f"  createSupportBarShape('{bar_type}', 500, 16) - PASSED")
+    shape = createSupportBarShape(bar_type, 500, 16)
+    assert shape is not None
+    print(f"  createSupportBarShape('{bar_type}', 500, 16) - PASSED")
 
 
 # -----------------------------------------------------------------------
 # FreeCAD object creation tests
 # -----------------------------------------------------------------------
 
-def test_createHinge_object():
+@pytest.fixture
+def fresh_doc():
+    """A new document per test, so each recompute only sees that test's object."""
+    doc = makeDoc("HardwareModelTests")
+    yield doc
+    closeDoc(doc)
+
+
+@pytest.mark.parametrize("hinge_type", list(HINGE_SPECS))
+def test_createHinge_object(fresh_doc, hinge_type):
     """Test Hinge FreeCAD object creation."""
+    from freecad.ShowerDesigner.Models.Hinge import createHinge
+
     print("\n" + "=" * 70)
-    print("Test: createHinge (FreeCAD object)")
+    print(f"Test: createHinge (FreeCAD object) - {hinge_type}")
     print("=" * 70)
 
     obj = createHinge("TestHinge")
@@ -163,20 +199,21 @@ def test_createHinge_object():
     assert hasattr(obj, "Finish")
     assert obj.HingeType == "standard_wall_mount"
 
-    # Change type and recompute
-    for hinge_type in HINGE_SPECS:
-        obj.HingeType = hinge_type
-        App.ActiveDocument.recompute()
-        expected_cap = HINGE_SPECS[hinge_type]["load_capacity_kg"]
-        assert obj.LoadCapacity == expected_cap, \
-            f"Expected capacity {expected_cap}, got {obj.LoadCapacity}"
-        print(f"  HingeType={hinge_type}, LoadCapacity={obj.LoadCapacity}kg - PASSED")
+    obj.HingeType = hinge_type
+    fresh_doc.recompute([obj])
+    expected_cap = HINGE_SPECS[hinge_type]["load_capacity_kg"]
+    assert obj.LoadCapacity == expected_cap, \
+        f"Expected capacity {expected_cap}, got {obj.LoadCapacity}"
+    print(f"  HingeType={hinge_type}, LoadCapacity={obj.LoadCapacity}kg - PASSED")
 
 
-def test_createClamp_object():
+@pytest.mark.parametrize("clamp_type", list(CLAMP_SPECS))
+def test_createClamp_object(fresh_doc, clamp_type):
     """Test Clamp FreeCAD object creation."""
+    from freecad.ShowerDesigner.Models.Clamp import createClamp
+
     print("\n" + "=" * 70)
-    print("Test: createClamp (FreeCAD object)")
+    print(f"Test: createClamp (FreeCAD object) - {clamp_type}")
     print("=" * 70)
 
     obj = createClamp("TestClamp")
@@ -185,18 +222,20 @@ def test_createClamp_object():
     assert hasattr(obj, "MountingType")
     assert hasattr(obj, "LoadCapacity")
 
-    for clamp_type in CLAMP_SPECS:
-        obj.ClampType = clamp_type
-        App.ActiveDocument.recompute()
-        expected_cap = CLAMP_SPECS[clamp_type]["load_capacity_kg"]
-        assert obj.LoadCapacity == expected_cap
-        print(f"  ClampType={clamp_type}, LoadCapacity={obj.LoadCapacity}kg - PASSED")
+    obj.ClampType = clamp_type
+    fresh_doc.recompute([obj])
+    expected_cap = CLAMP_SPECS[clamp_type]["load_capacity_kg"]
+    assert obj.LoadCapacity == expected_cap
+    print(f"  ClampType={clamp_type}, LoadCapacity={obj.LoadCapacity}kg - PASSED")
 
 
-def test_createHandle_object():
+@pytest.mark.parametrize("handle_type", list(HANDLE_SPECS))
+def test_createHandle_object(fresh_doc, handle_type):
     """Test Handle FreeCAD object creation."""
+    from freecad.ShowerDesigner.Models.Handle import createHandle
+
     print("\n" + "=" * 70)
-    print("Test: createHandle (FreeCAD object)")
+    print(f"Test: createHandle (FreeCAD object) - {handle_type}")
     print("=" * 70)
 
     obj = createHandle("TestHandle")
@@ -205,16 +244,18 @@ def test_createHandle_object():
     assert hasattr(obj, "HandleLength")
     assert hasattr(obj, "Finish")
 
-    for handle_type in HANDLE_SPECS:
-        obj.HandleType = handle_type
-        App.ActiveDocument.recompute()
-        print(f"  HandleType={handle_type} - PASSED")
+    obj.HandleType = handle_type
+    fresh_doc.recompute([obj])
+    print(f"  HandleType={handle_type} - PASSED")
 
 
-def test_createSupportBar_object():
+@pytest.mark.parametrize("bar_type", list(SUPPORT_BAR_SPECS))
+def test_createSupportBar_object(fresh_doc, bar_type):
     """Test SupportBar FreeCAD object creation."""
+    from freecad.ShowerDesigner.Models.SupportBar import createSupportBar
+
     print("\n" + "=" * 70)
-    print("Test: createSupportBar (FreeCAD object)")
+    print(f"Test: createSupportBar (FreeCAD object) - {bar_type}")
     print("=" * 70)
 
     obj = createSupportBar("TestSupportBar")
@@ -223,20 +264,27 @@ def test_createSupportBar_object():
     assert hasattr(obj, "Length")
     assert hasattr(obj, "Diameter")
 
-    for bar_type in SUPPORT_BAR_SPECS:
-        obj.BarType = bar_type
-        App.ActiveDocument.recompute()
-        print(f"  BarType={bar_type} - PASSED")
+    obj.BarType = bar_type
+    fresh_doc.recompute([obj])
+    print(f"  BarType={bar_type} - PASSED")
+
+
+def test_supportBar_diameter_clamp(fresh_doc):
+    """Test SupportBar diameter is clamped to the spec range."""
+    from freecad.ShowerDesigner.Models.SupportBar import createSupportBar
+
+    print("\n" + "=" * 70)
+    print("Test: createSupportBar diameter clamping")
+    print("=" * 70)
 
-    # Test diameter clamping
+    # SupportBar.onChanged clamps on assignment, no recompute needed
+    obj = createSupportBar("TestSupportBar")
     obj.BarType = "Horizontal"
     obj.Diameter = 5  # Below min (12)
-    App.ActiveDocument.recompute()
     assert obj.Diameter.Value >= 12, f"Diameter should clamp to >=12, got {obj.Diameter.Value}"
     print("  Diameter clamp (min) - PASSED")
 
     obj.Diameter = 30  # Above max (25)
-    App.ActiveDocument.recompute()
     assert obj.Diameter.Value <= 25, f"Diameter should clamp to <=25, got {obj.Diameter.Value}"
     print("  Diameter clamp (max) - PASSED")
 
@@ -245,28 +293,37 @@ def test_createSupportBar_object():
 # Runner
 # -----------------------------------------------------------------------
 
+def _runWithDoc(test, *args):
+    """Console runner equivalent of the fresh_doc fixture."""
+    doc = makeDoc("HardwareModelTests")
+    try:
+        test(doc, *args)
+    finally:
+        closeDoc(doc)
+
+
 def run_all_tests():
     """Run all hardware model tests."""
-    doc = App.ActiveDocument
-    if doc is None:
-        doc = App.newDocument("HardwareModelTests")
-        print(f"\nCreated document: {doc.Name}")
-    else:
-        print(f"\nUsing document: {doc.Name}")
-
     test_createHingeShape()
     test_createHandleShape_knob()
     test_createHandleShape_bar()
     test_createHandleShape_pull()
     test_createHandleShape_none()
-    test_createClampShape()
+    for clamp_type in CLAMP_SPECS:
+        test_createClampShape(clamp_type)
     test_uclamp_topology()
     test_lclamp_topology()
-    test_createSupportBarShape()
-    test_createHinge_object()
-    test_createClamp_object()
-    test_createHandle_object()
-    test_createSupportBar_object()
+    for bar_type in SUPPORT_BAR_SPECS:
+        test_createSupportBarShape(bar_type)
+    for hinge_type in HINGE_SPECS:
+        _runWithDoc(test_createHinge_object, hinge_type)
+    for clamp_type in CLAMP_SPECS:
+        _runWithDoc(test_createClamp_object, clamp_type)
+    for handle_type in HANDLE_SPECS:
+        _runWithDoc(test_createHandle_object, handle_type)
+    for bar_type in SUPPORT_BAR_SPECS:
+        _runWithDoc(test_createSupportBar_object, bar_type)
+    _runWithDoc(test_supportBar_diameter_clamp)
 
     print("\n" + "=" * 70)
     print("HARDWARE MODELS TEST SUITE COMPLETE")
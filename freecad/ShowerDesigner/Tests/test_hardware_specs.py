@@ -8,12 +8,22 @@ Pure Python tests — no FreeCAD required. Can run with plain pytest.
 
 Run:
     pytest freecad/ShowerDesigner/Tests/test_hardware_specs.py
+
+Every test only reads the module-level catalogues, so the cases can be
+spread freely over pytest-xdist workers:
+    pytest -n auto freecad/ShowerDesigner/Tests/test_hardware_specs.py
+
+For quick reruns while editing, pytest-testmon reruns only the tests whose
+code or data changed (the first run records the dependency database), and
+--ff puts the last failures first:
+    pytest --testmon --ff freecad/ShowerDesigner/Tests/test_hardware_specs.py
 """
 
-import sys
-sys.path.insert(
-    0, r"C:\Users\tclou\AppData\Roaming\FreeCAD\v1-1\Mod\ShowerDesigner"
-)
+from collections import Counter
+from functools import lru_cache
+from types import SimpleNamespace
+
+import pytest
 
 from freecad.ShowerDesigner.Data.HardwareSpecs import (
     HARDWARE_FINISHES,
@@ -68,6 +78,88 @@ from freecad.ShowerDesigner.Data.SealSpecs import (
 )
 
 
+# Expected catalogue structure, shared by the structure tests below
+_SEAL_REQUIRED_KEYS = frozenset({
+    "name", "category", "angle", "location", "dimensions", "material",
+    "product_codes",
+})
+_SEAL_VALID_CATEGORIES = frozenset({
+    "soft_lip", "bubble", "bottom", "hard_lip", "magnetic", "infill",
+})
+_SEAL_VALID_LOCATIONS = frozenset({"side", "bottom", "door"})
+_SEAL_VALID_ANGLES = frozenset({0, 90, 135, 180})
+
+_HANDLE_REQUIRED_KEYS = frozenset({
+    "name", "category", "mounting_type", "dimensions", "product_codes",
+})
+_HANDLE_VALID_CATEGORIES = frozenset({
+    "Knob", "Pull", "Towel_Bar", "Flush", "Custom_Kit",
+})
+
+_SLIDER_REQUIRED_KEYS = frozenset({
+    "name", "max_door_width", "max_weight_kg",
+    "door_glass_thickness", "fixed_glass_thickness",
+    "dimensions", "components", "product_codes",
+})
+_ROLLER_VARIANT_REQUIRED_KEYS = frozenset({
+    "code", "glass_cutout_depth", "door_top_deduction",
+    "fixed_door_clearance", "max_weight_kg", "door_glass_thickness",
+})
+
+_STAB_REQUIRED_KEYS = frozenset({
+    "name", "profile_shape", "component_type", "bar_diameter",
+    "dimensions", "product_codes",
+})
+_STAB_VALID_PROFILES = frozenset({"round", "square"})
+_STAB_VALID_TYPES = frozenset({"connector", "bar"})
+
+_PC_REQUIRED_KEYS = frozenset({"code", "material", "finish"})
+_SEAL_PC_REQUIRED_KEYS = frozenset({"code", "glass_thickness", "colour", "length"})
+
+# (key, spec) pairs of the catalogues walked by several tests
+_SEAL_ITEMS = tuple(CATALOGUE_SEAL_SPECS.items())
+_HANDLE_ITEMS = tuple(CATALOGUE_HANDLE_SPECS.items())
+_STAB_ITEMS = tuple(CATALOGUE_STABILISER_SPECS.items())
+_BEVEL_ITEMS = tuple(BEVEL_CLAMP_SPECS.items())
+_SLIDER_ITEMS = tuple(SLIDER_SYSTEM_SPECS.items())
+_STAB_PROFILE_COUNTS = Counter(s["profile_shape"] for _, s in _STAB_ITEMS)
+
+# Column view of the seal catalogue, one tuple per enum field; missing
+# fields read as None and are reported by the structure test
+_SEAL_COLUMNS = SimpleNamespace(
+    keys=tuple(k for k, _ in _SEAL_ITEMS),
+    category=tuple(s.get("category") for _, s in _SEAL_ITEMS),
+    location=tuple(s.get("location") for _, s in _SEAL_ITEMS),
+    angle=tuple(s.get("angle") for _, s in _SEAL_ITEMS),
+    material=tuple(s.get("material") for _, s in _SEAL_ITEMS),
+)
+
+# Reverse product code -> (key, product_code_dict) indexes
+_SEAL_CODE_INDEX = {pc["code"]: (k, pc) for k, s in _SEAL_ITEMS for pc in s["product_codes"]}
+_HANDLE_CODE_INDEX = {pc["code"]: (k, pc) for k, s in _HANDLE_ITEMS for pc in s["product_codes"]}
+_SLIDER_CODE_INDEX = {pc["code"]: (k, pc) for k, s in _SLIDER_ITEMS for pc in s["product_codes"]}
+_STAB_CODE_INDEX = {pc["code"]: (k, pc) for k, s in _STAB_ITEMS for pc in s["product_codes"]}
+
+# Memoized catalogue filters and selectSeal; the cached lists are shared
+# between tests, so tests must only read them
+_getSealsByCategory = lru_cache(maxsize=None)(getSealsByCategory)
+_getSealsByAngle = lru_cache(maxsize=None)(getSealsByAngle)
+_getSealsByLocation = lru_cache(maxsize=None)(getSealsByLocation)
+_getHandleModelsForCategory = lru_cache(maxsize=None)(getHandleModelsForCategory)
+_getStabilisersByProfile = lru_cache(maxsize=None)(getStabilisersByProfile)
+_getStabilisersByRole = lru_cache(maxsize=None)(getStabilisersByRole)
+_selectSeal = lru_cache(maxsize=None)(selectSeal)
+
+
+def _assert_product_codes_unique(catalogue, label):
+    """Fail listing every product code used more than once in a catalogue."""
+    counts = Counter(
+        pc["code"] for spec in catalogue.values() for pc in spec["product_codes"]
+    )
+    dups = sorted(code for code, n in counts.items() if n > 1)
+    assert not dups, f"Duplicate product codes in {label}: {dups}"
+
+
 # -----------------------------------------------------------------------
 # Data integrity tests
 # -----------------------------------------------------------------------
@@ -118,12 +210,14 @@ def test_clamp_specs_have_required_keys():
         assert "default_mounting" in spec
         assert "product_codes" in spec, f"{key} missing product_codes"
         for pc in spec["product_codes"]:
-            assert "code" in pc and "material" in pc and "finish" in pc
+            assert pc.keys() >= _PC_REQUIRED_KEYS, (
+                f"{key}/{pc.get('code')} missing {sorted(_PC_REQUIRED_KEYS - pc.keys())}"
+            )
 
 
 def test_bevel_clamp_specs_have_required_keys():
     assert len(BEVEL_CLAMP_SPECS) == 13  # 7 S/S 304 + 6 Brass
-    for key, spec in BEVEL_CLAMP_SPECS.items():
+    for key, spec in _BEVEL_ITEMS:
         assert "name" in spec, f"{key} missing name"
         assert "mounting_type" in spec, f"{key} missing mounting_type"
         assert spec["mounting_type"] in ("Wall-to-Glass", "Glass-to-Glass"), (
@@ -142,20 +236,18 @@ def test_bevel_clamp_specs_have_required_keys():
             assert dim_key in dims, f"{key} dimensions missing {dim_key}"
         assert "bounding_box" in spec, f"{key} missing bounding_box"
         assert "product_codes" in spec, f"{key} missing product_codes"
-        assert len(spec["product_codes"]) > 0, f"{key} has empty product_codes"
+        assert spec["product_codes"], f"{key} has empty product_codes"
         for pc in spec["product_codes"]:
-            assert "code" in pc and "material" in pc and "finish" in pc
+            assert pc.keys() >= _PC_REQUIRED_KEYS, (
+                f"{key}/{pc.get('code')} missing {sorted(_PC_REQUIRED_KEYS - pc.keys())}"
+            )
             assert "glass_thickness_range" in pc, (
                 f"{key}/{pc['code']} missing glass_thickness_range"
             )
 
 
 def test_bevel_clamp_product_codes_unique():
-    all_codes = []
-    for spec in BEVEL_CLAMP_SPECS.values():
-        for pc in spec["product_codes"]:
-            all_codes.append(pc["code"])
-    assert len(all_codes) == len(set(all_codes)), "Duplicate product codes in BEVEL_CLAMP_SPECS"
+    _assert_product_codes_unique(BEVEL_CLAMP_SPECS, "BEVEL_CLAMP_SPECS")
 
 
 def test_track_profiles_have_required_keys():
@@ -188,61 +280,49 @@ def test_seal_colours_and_materials():
 
 
 def test_catalogue_seal_specs_structure():
-    required_keys = {"name", "category", "angle", "location", "dimensions",
-                     "material", "product_codes"}
-    valid_categories = {"soft_lip", "bubble", "bottom", "hard_lip", "magnetic",
-                        "infill"}
-    valid_locations = {"side", "bottom", "door"}
-    valid_angles = {0, 90, 135, 180}
-    for key, spec in CATALOGUE_SEAL_SPECS.items():
-        for rk in required_keys:
-            assert rk in spec, f"{key} missing '{rk}'"
-        assert spec["category"] in valid_categories, (
-            f"{key} has invalid category '{spec['category']}'"
-        )
-        assert spec["location"] in valid_locations, (
-            f"{key} has invalid location '{spec['location']}'"
-        )
-        assert spec["angle"] in valid_angles, (
-            f"{key} has invalid angle {spec['angle']}"
-        )
-        assert spec["material"] in SEAL_MATERIALS, (
-            f"{key} has invalid material '{spec['material']}'"
-        )
-        assert len(spec["product_codes"]) > 0, f"{key} has no product codes"
+    for key, spec in _SEAL_ITEMS:
+        missing = _SEAL_REQUIRED_KEYS - spec.keys()
+        assert not missing, f"{key} missing {sorted(missing)}"
+        assert spec["product_codes"], f"{key} has no product codes"
         for pc in spec["product_codes"]:
-            assert "code" in pc, f"{key} product_code missing 'code'"
-            assert "glass_thickness" in pc, f"{key}/{pc['code']} missing 'glass_thickness'"
-            assert "colour" in pc, f"{key}/{pc['code']} missing 'colour'"
-            assert "length" in pc, f"{key}/{pc['code']} missing 'length'"
+            assert pc.keys() >= _SEAL_PC_REQUIRED_KEYS, (
+                f"{key}/{pc.get('code')} missing {sorted(_SEAL_PC_REQUIRED_KEYS - pc.keys())}"
+            )
             assert pc["length"] in (2500, 3000), (
                 f"{key}/{pc['code']} invalid length {pc['length']}"
             )
 
 
+@pytest.mark.parametrize("field, valid", [
+    ("category", _SEAL_VALID_CATEGORIES),
+    ("location", _SEAL_VALID_LOCATIONS),
+    ("angle", _SEAL_VALID_ANGLES),
+    ("material", frozenset(SEAL_MATERIALS)),
+])
+def test_catalogue_seal_enum_fields(field, valid):
+    values = getattr(_SEAL_COLUMNS, field)
+    assert valid.issuperset(values), (
+        f"invalid {field}: "
+        f"{[(k, v) for k, v in zip(_SEAL_COLUMNS.keys, values) if v not in valid]}"
+    )
+
+
 def test_catalogue_seal_specs_count():
     assert len(CATALOGUE_SEAL_SPECS) == 18
 
 
 def test_catalogue_seal_product_codes_unique():
-    seen = {}
-    for key, spec in CATALOGUE_SEAL_SPECS.items():
-        for pc in spec["product_codes"]:
-            code = pc["code"]
-            assert code not in seen, (
-                f"Duplicate product code '{code}' in '{key}' and '{seen[code]}'"
-            )
-            seen[code] = key
+    _assert_product_codes_unique(CATALOGUE_SEAL_SPECS, "CATALOGUE_SEAL_SPECS")
 
 
 def test_catalogue_seal_categories_populated():
     for cat in ("soft_lip", "bubble", "bottom", "hard_lip", "magnetic", "infill"):
-        result = getSealsByCategory(cat)
+        result = _getSealsByCategory(cat)
         assert len(result) >= 1, f"No seals in category '{cat}'"
 
 
 def test_getSealsByCategory_soft_lip():
-    result = getSealsByCategory("soft_lip")
+    result = _getSealsByCategory("soft_lip")
     assert len(result) == 5
     assert "centre_lip" in result
     assert "180_soft_lip" in result
@@ -250,7 +330,7 @@ def test_getSealsByCategory_soft_lip():
 
 
 def test_getSealsByCategory_magnetic():
-    result = getSealsByCategory("magnetic")
+    result = _getSealsByCategory("magnetic")
     assert len(result) == 3
     assert "90_180_magnetic" in result
     assert "180_flat_magnetic" in result
@@ -258,19 +338,19 @@ def test_getSealsByCategory_magnetic():
 
 
 def test_getSealsByCategory_empty():
-    result = getSealsByCategory("nonexistent")
+    result = _getSealsByCategory("nonexistent")
     assert result == []
 
 
 def test_getSealsByAngle_90():
-    result = getSealsByAngle(90)
+    result = _getSealsByAngle(90)
     assert "90_soft_lip" in result
     assert "90_hard_lip" in result
     assert "90_180_magnetic" in result
 
 
 def test_getSealsByAngle_180():
-    result = getSealsByAngle(180)
+    result = _getSealsByAngle(180)
     assert "180_soft_lip" in result
     assert "180_hard_lip" in result
     assert "double_hard_lip_h" in result
@@ -278,35 +358,28 @@ def test_getSealsByAngle_180():
 
 
 def test_getSealsByLocation_bottom():
-    result = getSealsByLocation("bottom")
+    result = _getSealsByLocation("bottom")
     assert len(result) == 2
     assert "wipe_seal_bubble" in result
     assert "drip_wipe_seal" in result
 
 
 def test_getSealsByLocation_door():
-    result = getSealsByLocation("door")
+    result = _getSealsByLocation("door")
     assert len(result) == 3
     assert "90_180_magnetic" in result
 
 
-def test_lookupSealProductCode_known():
-    key, pc = lookupSealProductCode("TSS-003-8")
-    assert key == "180_soft_lip"
-    assert pc["glass_thickness"] == "6-8"
-    assert pc["colour"] == "Clear"
-
-
-def test_lookupSealProductCode_magnetic():
-    key, pc = lookupSealProductCode("PSS-008A-8")
-    assert key == "90_180_magnetic"
-    assert pc["material"] == "PC"
-
-
-def test_lookupSealProductCode_infill():
-    key, pc = lookupSealProductCode("IS-180-10")
-    assert key == "180_g2g_infill"
-    assert pc["glass_thickness"] == "10"
+@pytest.mark.parametrize("code, expected_key, expected_fields", [
+    ("TSS-003-8", "180_soft_lip", {"glass_thickness": "6-8", "colour": "Clear"}),
+    ("PSS-008A-8", "90_180_magnetic", {"material": "PC"}),
+    ("IS-180-10", "180_g2g_infill", {"glass_thickness": "10"}),
+], ids=["known", "magnetic", "infill"])
+def test_lookupSealProductCode(code, expected_key, expected_fields):
+    key, pc = lookupSealProductCode(code)
+    assert key == expected_key
+    for field, value in expected_fields.items():
+        assert pc[field] == value
 
 
 def test_lookupSealProductCode_unknown():
@@ -340,177 +413,98 @@ def test_bottom_guide_specs():
 # Validation function tests
 # -----------------------------------------------------------------------
 
-def test_selectHinge_light_door():
-    result = selectHinge(30, 8)
-    assert result == "standard_wall_mount"
-
-
-def test_selectHinge_heavy_door():
-    result = selectHinge(60, 10)
-    assert result == "heavy_duty_wall_mount"
-
-
-def test_selectHinge_thin_glass_heavy():
+@pytest.mark.parametrize("weight, thickness, expected", [
+    (30, 8, "standard_wall_mount"),
+    (60, 10, "heavy_duty_wall_mount"),
     # 6mm glass is not in heavy_duty range, should fall back
-    result = selectHinge(60, 6)
-    assert result == "standard_wall_mount"
-
-
-def test_calculateHingePlacement_2_hinges():
-    positions = calculateHingePlacement(2000, 2)
-    assert len(positions) == 2
-    assert positions[0] == 300  # offset_bottom
-    assert positions[1] == 1700  # 2000 - 300
-
-
-def test_calculateHingePlacement_3_hinges():
-    positions = calculateHingePlacement(2000, 3)
-    assert len(positions) == 3
-    assert positions[0] == 300
-    assert positions[1] == 1000  # midpoint
-    assert positions[2] == 1700
-
-
-def test_calculateHingePlacement_custom_offsets():
-    positions = calculateHingePlacement(2000, 2, offset_top=200, offset_bottom=250)
-    assert len(positions) == 2
-    assert positions[0] == 250
-    assert positions[1] == 1800
-
-
-def test_validateHingeLoad_ok():
-    valid, msg = validateHingeLoad("standard_wall_mount", 40, 2)
-    assert valid is True
-
-
-def test_validateHingeLoad_exceeded():
-    valid, msg = validateHingeLoad("standard_wall_mount", 100, 2)
-    assert valid is False
-    assert "exceeds" in msg
-
-
-def test_validateHingeLoad_unknown_type():
-    valid, msg = validateHingeLoad("nonexistent_type", 10, 2)
-    assert valid is False
-
-
-def test_selectClamp_wall():
-    result = selectClamp(20, 8, "Wall")
-    assert result == "L_Clamp"
-
-
-def test_selectClamp_wall_heavy():
-    result = selectClamp(40, 10, "Wall")
-    assert result == "L_Clamp"
-
-
-def test_selectClamp_floor():
-    result = selectClamp(30, 8, "Floor")
-    assert result == "U_Clamp"
-
-
-def test_selectClamp_floor_heavy():
-    result = selectClamp(45, 10, "Floor")
-    assert result == "U_Clamp"
-
-
-def test_calculateClampPlacement_1():
-    positions = calculateClampPlacement(1000, 1)
-    assert len(positions) == 1
-    assert positions[0] == 700  # 1000 - wall_offset_top (300)
-
-
-def test_calculateClampPlacement_2():
-    positions = calculateClampPlacement(2000, 2, 300, 300)
-    assert len(positions) == 2
-    assert positions[0] == 300
-    assert positions[1] == 1700
-
-
-def test_calculateClampPlacement_3():
-    positions = calculateClampPlacement(2000, 3, 300, 300)
-    assert len(positions) == 3
-    assert positions[0] == 300
-    assert positions[1] == 1000
-    assert positions[2] == 1700
-
-
-def test_validateClampLoad_ok():
-    valid, msg = validateClampLoad("L_Clamp", 25, 2)
-    assert valid is True
-
-
-def test_validateClampLoad_exceeded():
-    valid, msg = validateClampLoad("L_Clamp", 100, 2)
-    assert valid is False
-
-
-def test_requiresSupportBar_walkin_wide():
-    required, reason = requiresSupportBar(1200, 2000, "walkin")
-    assert required is True
-
-
-def test_requiresSupportBar_walkin_narrow():
-    required, reason = requiresSupportBar(800, 2000, "walkin")
-    assert required is False
-
-
-def test_requiresSupportBar_fixed_tall():
-    required, reason = requiresSupportBar(900, 2500, "fixed")
-    assert required is True
-
-
-def test_requiresSupportBar_fixed_short():
-    required, reason = requiresSupportBar(900, 2000, "fixed")
-    assert required is False
-
-
-def test_validateHandlePlacement_ok():
-    valid, msg = validateHandlePlacement(1050)
-    assert valid is True
-
-
-def test_validateHandlePlacement_too_low():
-    valid, msg = validateHandlePlacement(200)
-    assert valid is False
-
-
-def test_validateHandlePlacement_too_high():
-    valid, msg = validateHandlePlacement(2000)
-    assert valid is False
-
-
-def test_validateHandlePlacement_ada_ok():
-    valid, msg = validateHandlePlacement(1000, ada_required=True)
-    assert valid is True
-
-
-def test_validateHandlePlacement_ada_too_low():
-    valid, msg = validateHandlePlacement(800, ada_required=True)
-    assert valid is False
-
-
-def test_validateHandlePlacement_ada_too_high():
-    valid, msg = validateHandlePlacement(1300, ada_required=True)
-    assert valid is False
-
-
-def test_selectSeal_bottom():
-    result = selectSeal("bottom", 8, 5)
-    # Now returns catalogue key when a catalogue seal spans the gap
-    assert result == "wipe_seal_bubble"
-
-
-def test_selectSeal_side():
-    result = selectSeal("side", 8, 5)
-    # Now returns catalogue key when a catalogue seal spans the gap
-    assert result == "centre_lip"
-
-
-def test_selectSeal_magnetic():
-    result = selectSeal("magnetic", 8, 5)
-    # Now returns catalogue key when a catalogue seal spans the gap
-    assert result == "90_180_magnetic"
+    (60, 6, "standard_wall_mount"),
+], ids=["light_door", "heavy_door", "thin_glass_heavy"])
+def test_selectHinge(weight, thickness, expected):
+    assert selectHinge(weight, thickness) == expected
+
+
+@pytest.mark.parametrize("count, offsets, expected", [
+    # offset_bottom, then 2000 - offset_top
+    (2, {}, [300, 1700]),
+    (3, {}, [300, 1000, 1700]),
+    (2, {"offset_top": 200, "offset_bottom": 250}, [250, 1800]),
+], ids=["2_hinges", "3_hinges", "custom_offsets"])
+def test_calculateHingePlacement(count, offsets, expected):
+    assert calculateHingePlacement(2000, count, **offsets) == expected
+
+
+@pytest.mark.parametrize("hinge_type, weight, expected, msg_word", [
+    ("standard_wall_mount", 40, True, None),
+    ("standard_wall_mount", 100, False, "exceeds"),
+    ("nonexistent_type", 10, False, None),
+], ids=["ok", "exceeded", "unknown_type"])
+def test_validateHingeLoad(hinge_type, weight, expected, msg_word):
+    valid, msg = validateHingeLoad(hinge_type, weight, 2)
+    assert valid is expected
+    if msg_word is not None:
+        assert msg_word in msg
+
+
+@pytest.mark.parametrize("weight, thickness, mounting, expected", [
+    (20, 8, "Wall", "L_Clamp"),
+    (40, 10, "Wall", "L_Clamp"),
+    (30, 8, "Floor", "U_Clamp"),
+    (45, 10, "Floor", "U_Clamp"),
+], ids=["wall", "wall_heavy", "floor", "floor_heavy"])
+def test_selectClamp(weight, thickness, mounting, expected):
+    assert selectClamp(weight, thickness, mounting) == expected
+
+
+@pytest.mark.parametrize("args, expected", [
+    ((1000, 1), [700]),  # 1000 - wall_offset_top (300)
+    ((2000, 2, 300, 300), [300, 1700]),
+    ((2000, 3, 300, 300), [300, 1000, 1700]),
+], ids=["1", "2", "3"])
+def test_calculateClampPlacement(args, expected):
+    assert calculateClampPlacement(*args) == expected
+
+
+@pytest.mark.parametrize("weight, expected", [
+    (25, True),
+    (100, False),
+], ids=["ok", "exceeded"])
+def test_validateClampLoad(weight, expected):
+    valid, msg = validateClampLoad("L_Clamp", weight, 2)
+    assert valid is expected
+
+
+@pytest.mark.parametrize("width, height, enclosure, expected", [
+    (1200, 2000, "walkin", True),
+    (800, 2000, "walkin", False),
+    (900, 2500, "fixed", True),
+    (900, 2000, "fixed", False),
+], ids=["walkin_wide", "walkin_narrow", "fixed_tall", "fixed_short"])
+def test_requiresSupportBar(width, height, enclosure, expected):
+    required, reason = requiresSupportBar(width, height, enclosure)
+    assert required is expected
+
+
+@pytest.mark.parametrize("height, ada_required, expected", [
+    (1050, False, True),
+    (200, False, False),
+    (2000, False, False),
+    (1000, True, True),
+    (800, True, False),
+    (1300, True, False),
+], ids=["ok", "too_low", "too_high", "ada_ok", "ada_too_low", "ada_too_high"])
+def test_validateHandlePlacement(height, ada_required, expected):
+    valid, msg = validateHandlePlacement(height, ada_required=ada_required)
+    assert valid is expected
+
+
+# selectSeal returns the catalogue key when a catalogue seal spans the gap
+@pytest.mark.parametrize("location, expected", [
+    ("bottom", "wipe_seal_bubble"),
+    ("side", "centre_lip"),
+    ("magnetic", "90_180_magnetic"),
+])
+def test_selectSeal(location, expected):
+    assert _selectSeal(location, 8, 5) == expected
 
 
 # -----------------------------------------------------------------------
@@ -548,38 +542,30 @@ def test_catalogue_handle_finishes_not_empty():
 
 
 def test_catalogue_handle_specs_structure():
-    required_keys = {"name", "category", "mounting_type", "dimensions", "product_codes"}
-    valid_categories = {"Knob", "Pull", "Towel_Bar", "Flush", "Custom_Kit"}
-    for key, spec in CATALOGUE_HANDLE_SPECS.items():
-        for rk in required_keys:
-            assert rk in spec, f"{key} missing '{rk}'"
-        assert spec["category"] in valid_categories, (
+    for key, spec in _HANDLE_ITEMS:
+        missing = _HANDLE_REQUIRED_KEYS - spec.keys()
+        assert not missing, f"{key} missing {sorted(missing)}"
+        assert spec["category"] in _HANDLE_VALID_CATEGORIES, (
             f"{key} has invalid category '{spec['category']}'"
         )
-        assert len(spec["product_codes"]) > 0, f"{key} has no product codes"
+        assert spec["product_codes"], f"{key} has no product codes"
 
 
 def test_catalogue_handle_product_codes_unique():
-    seen = {}
-    for key, spec in CATALOGUE_HANDLE_SPECS.items():
-        for pc in spec["product_codes"]:
-            code = pc["code"]
-            assert code not in seen, (
-                f"Duplicate product code '{code}' in '{key}' and '{seen[code]}'"
-            )
-            seen[code] = key
+    _assert_product_codes_unique(CATALOGUE_HANDLE_SPECS, "CATALOGUE_HANDLE_SPECS")
 
 
 def test_catalogue_handle_product_codes_have_material_finish():
-    for key, spec in CATALOGUE_HANDLE_SPECS.items():
+    for key, spec in _HANDLE_ITEMS:
         for pc in spec["product_codes"]:
-            assert "material" in pc, f"{key}/{pc['code']} missing 'material'"
-            assert "finish" in pc, f"{key}/{pc['code']} missing 'finish'"
+            assert pc.keys() >= _PC_REQUIRED_KEYS, (
+                f"{key}/{pc.get('code')} missing {sorted(_PC_REQUIRED_KEYS - pc.keys())}"
+            )
 
 
 def test_catalogue_handle_towel_rail_lengths():
     towel_keys = [
-        k for k, s in CATALOGUE_HANDLE_SPECS.items()
+        k for k, s in _HANDLE_ITEMS
         if s["category"] == "Towel_Bar" and "rail_lengths" in s
     ]
     assert len(towel_keys) >= 4, "Expected at least 4 towel rail entries with rail_lengths"
@@ -594,7 +580,7 @@ def test_catalogue_handle_towel_rail_lengths():
 
 
 def test_getHandleModelsForCategory_knob():
-    knobs = getHandleModelsForCategory("Knob")
+    knobs = _getHandleModelsForCategory("Knob")
     assert len(knobs) == 3
     assert "mushroom_knob_b2b" in knobs
     assert "groove_knob_b2b" in knobs
@@ -602,27 +588,25 @@ def test_getHandleModelsForCategory_knob():
 
 
 def test_getHandleModelsForCategory_towel_bar():
-    towels = getHandleModelsForCategory("Towel_Bar")
+    towels = _getHandleModelsForCategory("Towel_Bar")
     assert len(towels) == 5
     assert "towel_rail_round_finnial" in towels
 
 
 def test_getHandleModelsForCategory_empty():
-    result = getHandleModelsForCategory("NonexistentCategory")
+    result = _getHandleModelsForCategory("NonexistentCategory")
     assert result == []
 
 
-def test_lookupHandleProductCode_known():
-    key, pc = lookupHandleProductCode("DK-201")
-    assert key == "mushroom_knob_b2b"
-    assert pc["material"] == "Brass"
-    assert pc["finish"] == "Bright Chrome"
-
-
-def test_lookupHandleProductCode_towel_rail():
-    key, pc = lookupHandleProductCode("BH-040")
-    assert key == "towel_rail_round_finnial"
-    assert pc["rail_length"] == 400
+@pytest.mark.parametrize("code, expected_key, expected_fields", [
+    ("DK-201", "mushroom_knob_b2b", {"material": "Brass", "finish": "Bright Chrome"}),
+    ("BH-040", "towel_rail_round_finnial", {"rail_length": 400}),
+], ids=["known", "towel_rail"])
+def test_lookupHandleProductCode(code, expected_key, expected_fields):
+    key, pc = lookupHandleProductCode(code)
+    assert key == expected_key
+    for field, value in expected_fields.items():
+        assert pc[field] == value
 
 
 def test_lookupHandleProductCode_unknown():
@@ -636,16 +620,11 @@ def test_lookupHandleProductCode_unknown():
 # -----------------------------------------------------------------------
 
 def test_slider_system_specs_structure():
-    required_keys = {
-        "name", "max_door_width", "max_weight_kg",
-        "door_glass_thickness", "fixed_glass_thickness",
-        "dimensions", "components", "product_codes",
-    }
-    for key, spec in SLIDER_SYSTEM_SPECS.items():
-        for rk in required_keys:
-            assert rk in spec, f"{key} missing '{rk}'"
-        assert len(spec["product_codes"]) > 0, f"{key} has no product codes"
-        assert len(spec["components"]) > 0, f"{key} has no components"
+    for key, spec in _SLIDER_ITEMS:
+        missing = _SLIDER_REQUIRED_KEYS - spec.keys()
+        assert not missing, f"{key} missing {sorted(missing)}"
+        assert spec["product_codes"], f"{key} has no product codes"
+        assert spec["components"], f"{key} has no components"
 
 
 def test_slider_system_specs_three_systems():
@@ -669,32 +648,26 @@ def test_slider_system_edge_city_have_track_dims():
 
 
 def test_slider_system_product_codes_unique():
-    seen = {}
-    for key, spec in SLIDER_SYSTEM_SPECS.items():
-        for pc in spec["product_codes"]:
-            code = pc["code"]
-            assert code not in seen, (
-                f"Duplicate product code '{code}' in '{key}' and '{seen[code]}'"
-            )
-            seen[code] = key
+    _assert_product_codes_unique(SLIDER_SYSTEM_SPECS, "SLIDER_SYSTEM_SPECS")
 
 
 def test_slider_system_product_codes_have_material_finish():
-    for key, spec in SLIDER_SYSTEM_SPECS.items():
+    for key, spec in _SLIDER_ITEMS:
         for pc in spec["product_codes"]:
-            assert "material" in pc, f"{key}/{pc['code']} missing 'material'"
-            assert "finish" in pc, f"{key}/{pc['code']} missing 'finish'"
+            assert pc.keys() >= _PC_REQUIRED_KEYS, (
+                f"{key}/{pc.get('code')} missing {sorted(_PC_REQUIRED_KEYS - pc.keys())}"
+            )
 
 
 def test_slider_system_components_have_code():
-    for key, spec in SLIDER_SYSTEM_SPECS.items():
+    for key, spec in _SLIDER_ITEMS:
         for role, comp in spec["components"].items():
             assert "code" in comp, f"{key}/{role} missing 'code'"
             assert "qty_per_system" in comp, f"{key}/{role} missing 'qty_per_system'"
 
 
 def test_slider_system_all_have_floor_guide():
-    for key, spec in SLIDER_SYSTEM_SPECS.items():
+    for key, spec in _SLIDER_ITEMS:
         assert "floor_guide" in spec["components"], (
             f"{key} missing floor_guide component"
         )
@@ -710,13 +683,9 @@ def test_slider_system_city_has_roller_variants():
 
 def test_slider_system_city_roller_variants_required_keys():
     city = SLIDER_SYSTEM_SPECS["city_slider"]
-    required_keys = {
-        "code", "glass_cutout_depth", "door_top_deduction",
-        "fixed_door_clearance", "max_weight_kg", "door_glass_thickness",
-    }
     for variant_key, variant in city["roller_variants"].items():
-        for rk in required_keys:
-            assert rk in variant, f"city_slider variant '{variant_key}' missing '{rk}'"
+        missing = _ROLLER_VARIANT_REQUIRED_KEYS - variant.keys()
+        assert not missing, f"city_slider variant '{variant_key}' missing {sorted(missing)}"
 
 
 def test_slider_system_city_heavy_duty_weight():
@@ -761,54 +730,34 @@ def test_floor_guide_specs():
     assert FLOOR_GUIDE_SPECS["depth"] == 19
 
 
-def test_validateSliderSystem_ok():
-    valid, msg = validateSliderSystem("edge_slider", 800, 40, 8)
-    assert valid is True
-
-
-def test_validateSliderSystem_width_exceeded():
-    valid, msg = validateSliderSystem("duplo", 900, 20, 6)
-    assert valid is False
-    assert "width" in msg.lower()
-
-
-def test_validateSliderSystem_weight_exceeded():
-    valid, msg = validateSliderSystem("duplo", 700, 30, 6)
-    assert valid is False
-    assert "weight" in msg.lower()
-
-
-def test_validateSliderSystem_glass_unsupported():
-    valid, msg = validateSliderSystem("duplo", 700, 20, 10)
-    assert valid is False
-    assert "thickness" in msg.lower()
-
-
-def test_validateSliderSystem_unknown_system():
-    valid, msg = validateSliderSystem("nonexistent", 800, 30, 8)
-    assert valid is False
-
-
-def test_validateSliderSystem_city_wide_range():
+@pytest.mark.parametrize("system, width, weight, thickness, expected, msg_word", [
+    ("edge_slider", 800, 40, 8, True, None),
+    ("duplo", 900, 20, 6, False, "width"),
+    ("duplo", 700, 30, 6, False, "weight"),
+    ("duplo", 700, 20, 10, False, "thickness"),
+    ("nonexistent", 800, 30, 8, False, None),
     # City supports 6, 8, 10mm glass
-    valid, msg = validateSliderSystem("city_slider", 800, 40, 10)
-    assert valid is True
-    valid, msg = validateSliderSystem("city_slider", 800, 40, 6)
-    assert valid is True
-
-
-
-def test_lookupSliderProductCode_known():
-    key, pc = lookupSliderProductCode("RST-2000B")
-    assert key == "edge_slider"
-    assert pc["material"] == "S/S 304"
-    assert pc["finish"] == "Bright Polished"
-
-
-def test_lookupSliderProductCode_city():
-    key, pc = lookupSliderProductCode("CSLT-2000MB")
-    assert key == "city_slider"
-    assert pc["finish"] == "Matte Black"
+    ("city_slider", 800, 40, 10, True, None),
+    ("city_slider", 800, 40, 6, True, None),
+], ids=["ok", "width_exceeded", "weight_exceeded", "glass_unsupported",
+        "unknown_system", "city_10mm", "city_6mm"])
+def test_validateSliderSystem(system, width, weight, thickness, expected,
+                              msg_word):
+    valid, msg = validateSliderSystem(system, width, weight, thickness)
+    assert valid is expected
+    if msg_word is not None:
+        assert msg_word in msg.lower()
+
+
+@pytest.mark.parametrize("code, expected_key, expected_fields", [
+    ("RST-2000B", "edge_slider", {"material": "S/S 304", "finish": "Bright Polished"}),
+    ("CSLT-2000MB", "city_slider", {"finish": "Matte Black"}),
+], ids=["known", "city"])
+def test_lookupSliderProductCode(code, expected_key, expected_fields):
+    key, pc = lookupSliderProductCode(code)
+    assert key == expected_key
+    for field, value in expected_fields.items():
+        assert pc[field] == value
 
 
 def test_lookupSliderProductCode_unknown():
@@ -832,109 +781,86 @@ def test_catalogue_stabiliser_specs_count():
     assert len(CATALOGUE_STABILISER_SPECS) == 18
 
 
-def test_catalogue_stabiliser_specs_structure():
-    required_keys = {"name", "profile_shape", "component_type", "bar_diameter",
-                     "dimensions", "product_codes"}
-    valid_profiles = {"round", "square"}
-    valid_types = {"connector", "bar"}
-    for key, spec in CATALOGUE_STABILISER_SPECS.items():
-        for rk in required_keys:
-            assert rk in spec, f"{key} missing '{rk}'"
-        assert spec["profile_shape"] in valid_profiles, (
-            f"{key} has invalid profile_shape '{spec['profile_shape']}'"
+@pytest.mark.parametrize("key, spec", _STAB_ITEMS, ids=[k for k, _ in _STAB_ITEMS])
+def test_catalogue_stabiliser_entry(key, spec):
+    missing = _STAB_REQUIRED_KEYS - spec.keys()
+    assert not missing, f"{key} missing {sorted(missing)}"
+    assert spec["profile_shape"] in _STAB_VALID_PROFILES, (
+        f"{key} has invalid profile_shape '{spec['profile_shape']}'"
+    )
+    assert spec["component_type"] in _STAB_VALID_TYPES, (
+        f"{key} has invalid component_type '{spec['component_type']}'"
+    )
+    assert spec["bar_diameter"] == 19, f"{key} bar_diameter != 19"
+    assert spec["product_codes"], f"{key} has no product codes"
+    for pc in spec["product_codes"]:
+        assert pc.keys() >= _PC_REQUIRED_KEYS, (
+            f"{key}/{pc.get('code')} missing {sorted(_PC_REQUIRED_KEYS - pc.keys())}"
         )
-        assert spec["component_type"] in valid_types, (
-            f"{key} has invalid component_type '{spec['component_type']}'"
-        )
-        assert spec["bar_diameter"] == 19, f"{key} bar_diameter != 19"
-        assert len(spec["product_codes"]) > 0, f"{key} has no product codes"
-        for pc in spec["product_codes"]:
-            assert "code" in pc and "material" in pc and "finish" in pc
-
-
-def test_catalogue_stabiliser_connectors_have_role():
-    for key, spec in CATALOGUE_STABILISER_SPECS.items():
-        if spec["component_type"] == "connector":
-            assert "connector_role" in spec, f"{key} connector missing connector_role"
-            assert "bore" in spec, f"{key} connector missing bore"
-            assert "angle_adjustable" in spec, f"{key} connector missing angle_adjustable"
 
-
-def test_catalogue_stabiliser_bars_have_lengths():
-    for key, spec in CATALOGUE_STABILISER_SPECS.items():
-        if spec["component_type"] == "bar":
-            assert "bar_lengths" in spec, f"{key} bar missing bar_lengths"
-            assert len(spec["bar_lengths"]) >= 2, f"{key} should have multiple bar lengths"
-            for pc in spec["product_codes"]:
-                assert "bar_length" in pc, f"{key}/{pc['code']} missing bar_length"
-                assert pc["bar_length"] in spec["bar_lengths"], (
-                    f"{key}/{pc['code']} bar_length {pc['bar_length']} not in {spec['bar_lengths']}"
-                )
+    if spec["component_type"] == "connector":
+        assert "connector_role" in spec, f"{key} connector missing connector_role"
+        assert "bore" in spec, f"{key} connector missing bore"
+        assert "angle_adjustable" in spec, f"{key} connector missing angle_adjustable"
+    else:
+        assert "bar_lengths" in spec, f"{key} bar missing bar_lengths"
+        assert len(spec["bar_lengths"]) >= 2, f"{key} should have multiple bar lengths"
+        for pc in spec["product_codes"]:
+            assert "bar_length" in pc, f"{key}/{pc['code']} missing bar_length"
+            assert pc["bar_length"] in spec["bar_lengths"], (
+                f"{key}/{pc['code']} bar_length {pc['bar_length']} not in {spec['bar_lengths']}"
+            )
 
 
 def test_catalogue_stabiliser_product_codes_unique():
-    seen = {}
-    for key, spec in CATALOGUE_STABILISER_SPECS.items():
-        for pc in spec["product_codes"]:
-            code = pc["code"]
-            assert code not in seen, (
-                f"Duplicate product code '{code}' in '{key}' and '{seen[code]}'"
-            )
-            seen[code] = key
+    _assert_product_codes_unique(CATALOGUE_STABILISER_SPECS, "CATALOGUE_STABILISER_SPECS")
 
 
 def test_catalogue_stabiliser_round_count():
-    round_keys = [k for k, s in CATALOGUE_STABILISER_SPECS.items()
-                  if s["profile_shape"] == "round"]
-    assert len(round_keys) == 12  # 11 connectors + 1 bar
+    assert _STAB_PROFILE_COUNTS["round"] == 12  # 11 connectors + 1 bar
 
 
 def test_catalogue_stabiliser_square_count():
-    square_keys = [k for k, s in CATALOGUE_STABILISER_SPECS.items()
-                   if s["profile_shape"] == "square"]
-    assert len(square_keys) == 6  # 5 connectors + 1 bar
+    assert _STAB_PROFILE_COUNTS["square"] == 6  # 5 connectors + 1 bar
 
 
 def test_getStabilisersByProfile_round():
-    result = getStabilisersByProfile("round")
+    result = _getStabilisersByProfile("round")
     assert len(result) == 12
     assert "round_wall_flange" in result
     assert "round_19_bar" in result
 
 
 def test_getStabilisersByProfile_square():
-    result = getStabilisersByProfile("square")
+    result = _getStabilisersByProfile("square")
     assert len(result) == 6
     assert "square_wall_flange" in result
     assert "square_19_bar" in result
 
 
 def test_getStabilisersByRole_wall_flange():
-    result = getStabilisersByRole("wall_flange")
+    result = _getStabilisersByRole("wall_flange")
     assert len(result) == 2
     assert "round_wall_flange" in result
     assert "square_wall_flange" in result
 
 
 def test_getStabilisersByRole_tee_coupler():
-    result = getStabilisersByRole("tee_coupler")
+    result = _getStabilisersByRole("tee_coupler")
     assert len(result) == 2
     assert "round_tee_coupler" in result
     assert "square_tee_coupler" in result
 
 
-def test_lookupStabiliserProductCode_known():
-    key, pc = lookupStabiliserProductCode("KA-101-19")
-    assert key == "round_wall_flange"
-    assert pc["material"] == "Brass"
-    assert pc["finish"] == "Bright Chrome"
-
-
-def test_lookupStabiliserProductCode_bar():
-    key, pc = lookupStabiliserProductCode("SB19-2000B")
-    assert key == "round_19_bar"
-    assert pc["bar_length"] == 2000
-    assert pc["finish"] == "Bright Polished"
+@pytest.mark.parametrize("code, expected_key, expected_fields", [
+    ("KA-101-19", "round_wall_flange", {"material": "Brass", "finish": "Bright Chrome"}),
+    ("SB19-2000B", "round_19_bar", {"bar_length": 2000, "finish": "Bright Polished"}),
+], ids=["known", "bar"])
+def test_lookupStabiliserProductCode(code, expected_key, expected_fields):
+    key, pc = lookupStabiliserProductCode(code)
+    assert key == expected_key
+    for field, value in expected_fields.items():
+        assert pc[field] == value
 
 
 def test_lookupStabiliserProductCode_unknown():
@@ -943,6 +869,19 @@ def test_lookupStabiliserProductCode_unknown():
     assert pc is None
 
 
+@pytest.mark.parametrize("lookup, index", [
+    (lookupSealProductCode, _SEAL_CODE_INDEX),
+    (lookupHandleProductCode, _HANDLE_CODE_INDEX),
+    (lookupSliderProductCode, _SLIDER_CODE_INDEX),
+    (lookupStabiliserProductCode, _STAB_CODE_INDEX),
+], ids=["seal", "handle", "slider", "stabiliser"])
+def test_lookupProductCode_matches_index(lookup, index):
+    for code, (key, pc) in index.items():
+        found_key, found_pc = lookup(code)
+        assert found_key == key, f"{code}: expected '{key}', got '{found_key}'"
+        assert found_pc is pc, f"{code}: wrong product code entry"
+
+
 def test_support_bar_specs_default_diameter_19():
     for key, spec in SUPPORT_BAR_SPECS.items():
         assert spec["default_diameter"] == 19, (
@@ -955,35 +894,8 @@ def test_support_bar_specs_default_diameter_19():
 # -----------------------------------------------------------------------
 
 def run_all_tests():
-    """Run all tests and print results (for FreeCAD console)."""
-    import inspect
-    test_funcs = [
-        (name, func)
-        for name, func in sorted(globals().items())
-        if name.startswith("test_") and callable(func)
-    ]
-
-    passed = 0
-    failed = 0
-
-    print("=" * 70)
-    print("HARDWARE SPECS TEST SUITE")
-    print("=" * 70)
-
-    for name, func in test_funcs:
-        try:
-            func()
-            print(f"  PASSED: {name}")
-            passed += 1
-        except AssertionError as e:
-            print(f"  FAILED: {name} - {e}")
-            failed += 1
-        except Exception as e:
-            print(f"  ERROR:  {name} - {e}")
-            failed += 1
-
-    print(f"\n{passed} passed, {failed} failed out of {len(test_funcs)} tests")
-    print("=" * 70)
+    """Run all tests through pytest (for FreeCAD console)."""
+    return pytest.main([__file__, "-q"])
 
 
 if __name__ == "__main__":
@@ -8,24 +8,15 @@ Run this in FreeCAD's Python console:
     exec(open('path/to/test_hinged_door.py').read())
 """
 
-import sys
-sys.path.insert(
-    0, r"C:\Users\tclou\AppData\Roaming\FreeCAD\v1-1\Mod\ShowerDesigner"
-)
-
 import FreeCAD as App
+from freecad.ShowerDesigner.Models.ChildProxies import isHardwareChild
 from freecad.ShowerDesigner.Models.HingedDoor import createHingedDoor
-
-
-def _get_varset(part_obj):
-    for child in part_obj.Group:
-        if child.TypeId == "App::VarSet":
-            return child
-    return None
-
-
-def _get_children_by_prefix(part_obj, prefix):
-    return [c for c in part_obj.Group if c.Label.startswith(prefix)]
+from freecad.ShowerDesigner.Tests.assembly_helpers import (
+    closeDoc,
+    get_varset,
+    group_index,
+    makeDoc,
+)
 
 
 def test_basic_creation():
@@ -39,11 +30,12 @@ def test_basic_creation():
         assert door.TypeId == "App::Part", f"Expected App::Part, got {door.TypeId}"
         print("  OK: Object is App::Part")
 
-        vs = _get_varset(door)
+        vs = get_varset(door)
         assert vs is not None, "VarSet not found"
         print("  OK: VarSet found")
 
-        glass = _get_children_by_prefix(door, "Glass")
+        idx = group_index(door)
+        glass = idx.get("Glass", [])
         assert len(glass) == 1, f"Expected 1 Glass child, got {len(glass)}"
         print("  OK: Glass child found")
 
@@ -55,11 +47,11 @@ def test_basic_creation():
         assert vs.HandleType == "mushroom_knob_b2b"
         print("  OK: VarSet default properties correct")
 
-        hinges = _get_children_by_prefix(door, "Hinge")
+        hinges = idx.get("Hinge", [])
         assert len(hinges) == 2, f"Expected 2 Hinge children, got {len(hinges)}"
         print("  OK: 2 hinge children created")
 
-        handles = _get_children_by_prefix(door, "Handle")
+        handles = idx.get("Handle", [])
         assert len(handles) == 1, f"Expected 1 Handle child, got {len(handles)}"
         print("  OK: Handle child created")
 
@@ -83,20 +75,25 @@ def test_hinge_configurations():
         ("RightOutward3", "Right", "Outward", 3),
     ]
 
+    # A fresh door per case, so a failing case cannot leave a half
+    # reconfigured assembly behind for the next one
     for name, side, direction, count in configs:
+        doc = makeDoc("HingedDoorTest")
         try:
             door = createHingedDoor(name)
-            vs = _get_varset(door)
+            vs = get_varset(door)
             vs.HingeSide = side
             vs.SwingDirection = direction
             vs.HingeCount = count
-            App.ActiveDocument.recompute()
+            doc.recompute()
 
-            hinges = _get_children_by_prefix(door, "Hinge")
+            hinges = group_index(door).get("Hinge", [])
             assert len(hinges) == count, f"Expected {count} hinges, got {len(hinges)}"
             print(f"  {name}: {side} hinges, {direction} swing, {count} hinges - PASSED")
         except Exception as e:
             print(f"  {name}: FAILED - {e}")
+        finally:
+            closeDoc(doc)
 
 
 def test_handle_types():
@@ -106,14 +103,14 @@ def test_handle_types():
     print("=" * 70)
 
     for handle_type in ["None", "mushroom_knob_b2b", "pull_handle_round", "flush_handle_with_plate"]:
+        doc = makeDoc("HingedDoorTest")
         try:
-            safe_name = handle_type.replace("_", "")
-            door = createHingedDoor(f"Handle_{safe_name}")
-            vs = _get_varset(door)
+            door = createHingedDoor("HandleTypes")
+            vs = get_varset(door)
             vs.HandleType = handle_type
-            App.ActiveDocument.recompute()
+            doc.recompute()
 
-            handles = _get_children_by_prefix(door, "Handle")
+            handles = group_index(door).get("Handle", [])
             if handle_type == "None":
                 assert len(handles) == 0, f"Expected 0 handles for None, got {len(handles)}"
             else:
@@ -121,6 +118,8 @@ def test_handle_types():
             print(f"  HandleType={handle_type} - PASSED")
         except Exception as e:
             print(f"  HandleType={handle_type}: FAILED - {e}")
+        finally:
+            closeDoc(doc)
 
 
 def test_swing_arc():
@@ -131,17 +130,17 @@ def test_swing_arc():
 
     try:
         door = createHingedDoor("SwingArcTest")
-        vs = _get_varset(door)
+        vs = get_varset(door)
         vs.ShowSwingArc = True
         App.ActiveDocument.recompute()
 
-        arcs = _get_children_by_prefix(door, "SwingArc")
+        arcs = group_index(door).get("SwingArc", [])
         assert len(arcs) == 1, f"Expected 1 SwingArc, got {len(arcs)}"
         print("  ShowSwingArc=True: arc created - PASSED")
 
         vs.ShowSwingArc = False
         App.ActiveDocument.recompute()
-        arcs = _get_children_by_prefix(door, "SwingArc")
+        arcs = group_index(door).get("SwingArc", [])
         assert len(arcs) == 0, f"Expected 0 SwingArc when off, got {len(arcs)}"
         print("  ShowSwingArc=False: arc removed - PASSED")
     except Exception as e:
@@ -158,22 +157,27 @@ def test_show_hardware_toggle():
 
     try:
         door = createHingedDoor("HardwareToggle")
-        vs = _get_varset(door)
+        vs = get_varset(door)
         vs.ShowHardware = True
         App.ActiveDocument.recompute()
 
-        hw = [c for c in door.Group
-              if c.TypeId != "App::VarSet" and c.Label != "Glass"]
+        hw = [c for c in door.Group if isHardwareChild(c)]
         assert len(hw) > 0, "Expected hardware children when ShowHardware=True"
+        names = sorted(c.Name for c in hw)
         print(f"  ShowHardware=True: {len(hw)} hardware children - OK")
 
         vs.ShowHardware = False
         App.ActiveDocument.recompute()
-        hw = [c for c in door.Group
-              if c.TypeId != "App::VarSet" and c.Label != "Glass"]
-        # Hinges and handle removed, but SwingArc is separate (controlled by ShowSwingArc)
-        assert len(hw) == 0, f"Expected 0 hardware children, got {len(hw)}"
-        print("  ShowHardware=False: 0 hardware children - OK")
+        hw = [c for c in door.Group if isHardwareChild(c)]
+        assert sorted(c.Name for c in hw) == names, "Hardware should be kept"
+        shown = [c.Label for c in hw if c.Visibility]
+        assert not shown, f"Expected all hardware hidden, still shown: {shown}"
+        print("  ShowHardware=False: hardware kept but hidden - OK")
+
+        vs.ShowHardware = True
+        App.ActiveDocument.recompute()
+        assert all(c.Visibility for c in hw), "Hardware should be shown again"
+        print("  ShowHardware=True again: hardware shown - OK")
 
         print("  Status: PASSED")
     except Exception as e:
@@ -190,7 +194,7 @@ def test_calculated_properties():
 
     try:
         door = createHingedDoor("CalcTest")
-        vs = _get_varset(door)
+        vs = get_varset(door)
         vs.Width = 1200
         vs.Height = 2200
         vs.Thickness = 12
@@ -223,6 +227,8 @@ def run_all_tests():
     test_basic_creation()
     test_hinge_configurations()
     test_handle_types()
+    # Closing the per-case documents above leaves no document active
+    App.setActiveDocument(doc.Name)
     test_swing_arc()
     test_show_hardware_toggle()
     test_calculated_properties()
@@ -8,12 +8,8 @@ Run this in FreeCAD's Python console:
     exec(open('path/to/test_sliding_door.py').read())
 """
 
-import sys
-sys.path.insert(
-    0, r"C:\Users\tclou\AppData\Roaming\FreeCAD\v1-1\Mod\ShowerDesigner"
-)
-
 import FreeCAD as App
+from freecad.ShowerDesigner.Models.ChildProxies import isHardwareChild
 from freecad.ShowerDesigner.Models.SlidingDoor import createSlidingDoor
 
 
@@ -204,19 +200,23 @@ def test_show_hardware_toggle():
         vs.ShowHardware = True
         App.ActiveDocument.recompute()
 
-        hw = [c for c in door.Group
-              if c.TypeId != "App::VarSet"
-              and not c.Label.startswith("Panel")]
+        hw = [c for c in door.Group if isHardwareChild(c)]
         assert len(hw) > 0, "Expected hardware children when ShowHardware=True"
+        names = sorted(c.Name for c in hw)
         print(f"  ShowHardware=True: {len(hw)} hardware children - OK")
 
         vs.ShowHardware = False
         App.ActiveDocument.recompute()
-        hw = [c for c in door.Group
-              if c.TypeId != "App::VarSet"
-              and not c.Label.startswith("Panel")]
-        assert len(hw) == 0, f"Expected 0 hardware children, got {len(hw)}"
-        print("  ShowHardware=False: 0 hardware children - OK")
+        hw = [c for c in door.Group if isHardwareChild(c)]
+        assert sorted(c.Name for c in hw) == names, "Hardware should be kept"
+        shown = [c.Label for c in hw if c.Visibility]
+        assert not shown, f"Expected all hardware hidden, still shown: {shown}"
+        print("  ShowHardware=False: hardware kept but hidden - OK")
+
+        vs.ShowHardware = True
+        App.ActiveDocument.recompute()
+        assert all(c.Visibility for c in hw), "Hardware should be shown again"
+        print("  ShowHardware=True again: hardware shown - OK")
 
         print("  Status: PASSED")
     except Exception as e: